@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -14,6 +15,10 @@ WORKUA_MAP_PATH = PROJECT_ROOT / "app" / "config" / "workua_filters_map.json"
 
 SOURCE_MAP = {"work": "workua", "robota": "robotaua", "linkedin": "linkedin"}
 
+# Скомпільовані один раз патерни для гарячого шляху interpret_query
+_WS_RE = re.compile(r"\s+")
+_CITY_KV_RE = re.compile(r"(?:city\s*[:=]\s*)([a-z0-9_-]+)$", re.IGNORECASE)
+
 
 class SearchPayload(BaseModel):
     """Суворий контракт даних для всіх джерел (Work, robota, LinkedIn)"""
@@ -43,6 +48,20 @@ class SearchPayload(BaseModel):
 
 NEGATION_WORDS = ["кроме", "без", "не"]
 
+# Шаблони вихідних словників interpret_query: ключі оголошуються один раз
+# на рівні модуля, на виклик залишається copy() + заповнення значень.
+_CRITERIA_TEMPLATE: Dict[str, Any] = {
+    "internal_mandatory": (),
+    "desirable": (),
+    "role_anchors": (),
+    "source_query": None,
+}
+_PAYLOAD_EXTRAS_TEMPLATE: Dict[str, Any] = {
+    "pages": 100,
+    "out": "out/result.jsonl",
+    "params": None,
+}
+
 
 def interpret_query(user_text: str) -> dict:
     user_text = (user_text or "").strip()
@@ -87,7 +106,7 @@ def interpret_query(user_text: str) -> dict:
             query_text = re.sub(pattern, "", query_text, flags=re.IGNORECASE).strip()
             break
 
-    query_text = re.sub(r"\s+", " ", query_text).strip()
+    query_text = _WS_RE.sub(" ", query_text).strip()
 
     # 4) Extract role keywords for Work.ua search
     # Work.ua НЕ має фільтру "категорія резюме" — тільки ключові слова
@@ -168,12 +187,13 @@ def interpret_query(user_text: str) -> dict:
     parsed_criteria.setdefault("languages", [])
 
     # Нова Тріо-модель
-    criteria_bundle: Dict[str, Any] = {
-        "internal_mandatory": parsed_criteria.get("internal_mandatory", []),
-        "desirable": parsed_criteria.get("desirable", []),
-        "role_anchors": [parsed_criteria.get("role", "")],
-        "source_query": user_text,
-    }
+    criteria_bundle: Dict[str, Any] = _CRITERIA_TEMPLATE.copy()
+    criteria_bundle["internal_mandatory"] = parsed_criteria.get(
+        "internal_mandatory", []
+    )
+    criteria_bundle["desirable"] = parsed_criteria.get("desirable", [])
+    criteria_bundle["role_anchors"] = [parsed_criteria.get("role", "")]
+    criteria_bundle["source_query"] = user_text
 
     # Оновлюємо query_text для Work.ua ТІЛЬКИ роллю, щоб краулер шукав точно
     query_text = parsed_criteria.get("role", query_text)
@@ -234,8 +254,7 @@ def interpret_query(user_text: str) -> dict:
 
     # Конвертуємо в словник для адаптерів
     search_payload = payload_obj.model_dump()
-    search_payload["pages"] = 100
-    search_payload["out"] = "out/result.jsonl"
+    search_payload.update(_PAYLOAD_EXTRAS_TEMPLATE)
     search_payload["params"] = {}
 
     # Каскадний мапінг для Work.ua: включаємо цільовий досвід і всі вищі рівні
@@ -266,21 +285,53 @@ def interpret_query(user_text: str) -> dict:
 # -------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _try_load_workua_map() -> Optional[Dict[str, Any]]:
+    """
+    Load and parse workua_filters_map.json once per process.
+
+    The file is static configuration, so the parsed dict is cached in-process
+    (use `_try_load_workua_map.cache_clear()` in tests to force a reload).
+    The location subtree is indexed once into `__slug_index__` so that city
+    validation is an O(1) set lookup instead of a recursive walk per query.
+    """
     if not WORKUA_MAP_PATH.exists():
         return None
     try:
         with WORKUA_MAP_PATH.open("r", encoding="utf-8") as f:
             obj = json.load(f)
-        return obj if isinstance(obj, dict) else None
+        if not isinstance(obj, dict):
+            return None
+        obj["__slug_index__"] = _build_slug_index(obj.get("location"))
+        return obj
     except Exception:
         return None
 
 
+def _build_slug_index(location: Any) -> frozenset:
+    """Collect every city slug from the location subtree in one iterative pass."""
+    slugs: set = set()
+    if location is None:
+        return frozenset()
+    if isinstance(location, dict):
+        slugs.update(str(k).lower() for k in location.keys())
+    stack = [location]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            slug = cur.get("slug")
+            if slug:
+                slugs.add(str(slug).lower())
+            stack.extend(cur.values())
+        elif isinstance(cur, list):
+            stack.extend(cur)
+    return frozenset(slugs)
+
+
 def _extract_query_and_city(
     user_text: str, workua_map: Optional[Dict[str, Any]]
 ) -> Tuple[str, Optional[str]]:
-    clean = re.sub(r"\s+", " ", user_text).strip()
+    clean = _WS_RE.sub(" ", user_text).strip()
     if not clean:
         return "", None
 
@@ -309,7 +360,7 @@ def _extract_query_and_city(
                 clean,
                 flags=re.IGNORECASE,
             ).strip()
-            query_text = re.sub(r"\s+", " ", query_text).strip()
+            query_text = _WS_RE.sub(" ", query_text).strip()
             return query_text, slug
 
     tokens = clean.split(" ")
@@ -320,14 +371,14 @@ def _extract_query_and_city(
         query_text = " ".join(tokens[:-1]).strip()
         return query_text, known_city_slug
 
-    m = re.search(r"(?:city\s*[:=]\s*)([a-z0-9_-]+)$", clean, flags=re.IGNORECASE)
+    m = _CITY_KV_RE.search(clean)
     if m:
         cand = m.group(1).strip().lower()
         known_city_slug = _match_city_slug(cand, workua_map)
         if known_city_slug:
-            query_text = re.sub(
-                r"(?:city\s*[:=]\s*)([a-z0-9_-]+)$", "", clean, flags=re.IGNORECASE
-            ).strip()
+            # Match is anchored at the end, so a slice is equivalent to sub("")
+            # without a second regex pass over the string.
+            query_text = clean[: m.start()].rstrip()
             return query_text, known_city_slug
 
     return clean, None
@@ -348,10 +399,21 @@ def _match_city_slug(
         # Return None to avoid inventing city slugs.
         return None
 
+    # Normalize exactly once; every branch below compares against this form.
+    cand = candidate.strip().lower()
+    if not cand:
+        return None
+
     # Try common structures:
     # - workua_map["location"]["values"]...
     # - workua_map["location"]...
     # We search any dict/list for {"slug": candidate} or direct key match.
+    # Fast path: precomputed index built by _try_load_workua_map —
+    # one lowercase, one hash lookup.
+    slug_index = workua_map.get("__slug_index__") if isinstance(workua_map, dict) else None
+    if slug_index is not None:
+        return cand if cand in slug_index else None
+
     location = workua_map.get("location") if isinstance(workua_map, dict) else None
     if location is None:
         return None
@@ -361,32 +423,33 @@ def _match_city_slug(
         for item in location["values"]:
             if (
                 isinstance(item, dict)
-                and str(item.get("slug", "")).lower() == candidate
+                and str(item.get("slug", "")).lower() == cand
             ):
-                return candidate
+                return cand
 
-    # Case B: dict of slugs -> ...
-    if isinstance(location, dict) and candidate in {
-        str(k).lower() for k in location.keys()
-    }:
-        return candidate
+    # Case B: dict of slugs -> ... (short-circuits, no per-call set build)
+    if isinstance(location, dict) and any(
+        str(k).lower() == cand for k in location.keys()
+    ):
+        return cand
 
     # Case C: nested search (best-effort)
-    if _deep_contains_slug(location, candidate):
-        return candidate
+    if _deep_contains_slug(location, cand):
+        return cand
 
     return None
 
 
 def _deep_contains_slug(obj: Any, slug: str) -> bool:
-    if isinstance(obj, dict):
-        if str(obj.get("slug", "")).lower() == slug:
-            return True
-        for v in obj.values():
-            if _deep_contains_slug(v, slug):
-                return True
-    elif isinstance(obj, list):
-        for x in obj:
-            if _deep_contains_slug(x, slug):
+    # Ітеративний обхід зі стеком замість рекурсії:
+    # один кадр виклику замість depth-N.
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            if str(cur.get("slug", "")).lower() == slug:
                 return True
+            stack.extend(cur.values())
+        elif isinstance(cur, list):
+            stack.extend(cur)
     return False
@@ -1,10 +1,22 @@
 import json
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import orjson
+
+    def _load_json_file(path: Path) -> Any:
+        return orjson.loads(path.read_bytes())
+
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _load_json_file(path: Path) -> Any:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
 
 class Settings(BaseSettings):
     # --- Basic Info ---
@@ -62,7 +74,16 @@ class Settings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
 
+    @cached_property
+    def retry_http_codes_set(self) -> FrozenSet[int]:
+        """RETRY_HTTP_CODES как frozenset для O(1) membership на hot path."""
+        return frozenset(self.RETRY_HTTP_CODES)
+
     def load_filters_map(self, source: str = "workua") -> Dict[str, Any]:
+        # Карты фильтров статичны — читаем и парсим файл один раз на источник.
+        cached = self._filters_cache.get(source)
+        if cached is not None:
+            return cached
         path = (
             self.WORKUA_FILTERS_PATH
             if source == "workua"
@@ -70,8 +91,13 @@ class Settings(BaseSettings):
         )
         if not path.exists():
             raise FileNotFoundError(f"Filters map for {source} not found at {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        filters_map = _load_json_file(path)
+        self._filters_cache[source] = filters_map
+        return filters_map
+
+    @cached_property
+    def _filters_cache(self) -> Dict[str, Dict[str, Any]]:
+        return {}
 
     @property
     def get_proxy_list(self) -> List[str]:
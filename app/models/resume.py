@@ -1,8 +1,14 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Канонічні моделі створюються на кожного кандидата у вибірці —
+# фіксуємо дешевий конфіг без додаткових проходів валідації.
+_HOT_MODEL_CONFIG = ConfigDict(extra="ignore", validate_default=False)
 
 
 class Experience(BaseModel):
+    model_config = _HOT_MODEL_CONFIG
+
     company: Optional[str] = None
     role: Optional[str] = None
     period: Optional[str] = None
@@ -10,12 +16,16 @@ class Experience(BaseModel):
 
 
 class Education(BaseModel):
+    model_config = _HOT_MODEL_CONFIG
+
     institution: Optional[str] = None
     degree: Optional[str] = None
     year_end: Optional[int] = None
 
 
 class Language(BaseModel):
+    model_config = _HOT_MODEL_CONFIG
+
     name: Optional[str] = None
     level: Optional[str] = None
 
@@ -23,6 +33,8 @@ class Language(BaseModel):
 class Resume(BaseModel):
     """Канонічна модель профілю кандидата"""
 
+    model_config = _HOT_MODEL_CONFIG
+
     id: str = Field(..., description="Унікальний ідентифікатор резюме")
     source: str = Field(
         ..., description="Джерело походження ('workua', 'robotaua', тощо)"
@@ -98,8 +98,11 @@ def get_adapter(source: str):
     return get_legacy_adapter(source)
 
 
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def extract_resume_id(url: str) -> Optional[str]:
-    matches = re.findall(r"\d+", url or "")
+    matches = _DIGITS_RE.findall(url or "")
     if matches:
         return matches[-1]
     return None
@@ -112,11 +115,16 @@ def should_skip(url: str, resume_id: Optional[str] = None) -> bool:
 
 
 def _filter_new_urls(urls: List[str]) -> Tuple[List[str], int]:
+    # Дедупликация одним батчем: repo.filter_new — один set-difference
+    # для JSONL-хранилища вместо N вызовов exists через should_skip.
+    repo = get_repository()
+    keys = [extract_resume_id(url) or f"url:{url}" for url in urls]
+    new_keys = repo.filter_new(keys)
+
     filtered = []
     skipped = 0
-    for url in urls:
-        resume_id = extract_resume_id(url)
-        if should_skip(url, resume_id):
+    for url, key in zip(urls, keys):
+        if key not in new_keys:
             skipped += 1
             logger.debug("Skipping duplicate resume before adapter run: %s", url)
             continue
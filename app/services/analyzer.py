@@ -1,13 +1,132 @@
 from __future__ import annotations
+import io
 import json
 import logging
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Callable, Dict, List, Optional, Sequence
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from app.models.agent import AnalysisResult
 
+# orjson (C/Rust) ускоряет и dump критериев, и whole-text parse ответа LLM;
+# без него прозрачно работаем через stdlib json.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - среда без orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Hot-path patterns compiled once at import: sanitization and skill
+# splitting run per resume, so we skip the re-module cache lookup there.
+# Control chars are deleted with one C-level translate pass instead of a
+# regex sub; role markers are escaped by a single alternation instead of
+# six chained str.replace scans.
+_CTRL_TRANS = dict.fromkeys(
+    [*range(0, 9), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F], None
+)
+_WS_RUN_RE = re.compile(r"[ \t]{2,}")
+_ROLE_TAG_RE = re.compile(r"</?(?:system|assistant|user)>")
+# Токены навыков матчим напрямую (дополнение к разделителям [,;•\n]):
+# finditer + islice останавливаются на лимите, не материализуя весь split.
+_SKILL_TOKEN_RE = re.compile(r"[^,;•\n]+")
+
+
+def _escape_role_tag(m: "re.Match[str]") -> str:
+    return m.group(0).replace("<", "&lt;").replace(">", "&gt;")
+
+
+# Единая точка "красивой" JSON-сериализации промпта: orjson, когда есть
+# (C-сериализатор, кириллица без ensure_ascii-экранирования), иначе stdlib.
+def _dumps_indent(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# Resumes repeat the same strings a lot (company names across experience
+# entries, boilerplate degree titles) — a small LRU collapses the repeated
+# strip/allocation work across items and across resumes in one session.
+@lru_cache(maxsize=1024)
+def _clean_str(v: str) -> str:
+    return v.strip()
+
+
+# Key-priority tuples for experience/education items, hoisted so the
+# per-item extraction is one helper call instead of an or-chain of gets.
+_EXP_ROLE_KEYS = ("position", "title", "role")
+_PERIOD_KEYS = ("period", "dates")
+_DESC_KEYS = ("description", "details")
+_EDU_DEGREE_KEYS = ("degree", "title")
+_EDU_SCHOOL_KEYS = ("institution", "school")
+
+# Потолок кеша собранных текстов резюме (см. _optimize_resume_data).
+_RESUME_TEXT_CACHE_MAX = 128
+
+# Сентинел для _pre_screen: «резюме идёт в LLM» (None — валидный
+# результат «пропустить», поэтому обычного None недостаточно).
+_NO_SHORT_CIRCUIT = object()
+
+# Один TypeAdapter на модуль: валидатор собран на импорте, без
+# повторного резолва по классу на каждый ответ LLM.
+_ANALYSIS_ADAPTER = TypeAdapter(AnalysisResult)
+
+# Поля со свободным текстом в порядке приоритета; about_raw — основной
+# (Work.ua кладёт туда загруженный файл / quick view целиком).
+_FULL_TEXT_FIELDS = (
+    "about_raw",
+    "full_text",
+    "raw_text",
+    "content",
+    "description",
+    "text",
+    "version_for_quick_view",
+    "quick_view",
+    "summary",
+)
+
+
+# Дешёвая проверка формы ответа LLM перед fast-path'ом model_construct:
+# полный обход pydantic-core схемы оставляем только для ответов,
+# не прошедших её (редкий случай у дисциплинированной модели).
+def _matches_analysis_shape(obj: Dict[str, Any]) -> bool:
+    if not isinstance(obj.get("status"), str):
+        return False
+    if not isinstance(obj.get("reasoning"), str):
+        return False
+    if not isinstance(obj.get("verdict"), (str, type(None))):
+        return False
+    for key in ("evidence", "missing_criteria"):
+        v = obj.get(key, [])
+        if not isinstance(v, list) or not all(
+            isinstance(x, str) for x in v
+        ):
+            return False
+    return True
+
+
+# Семантическая пустота: [{}, {}] или {"x": []} не стоят полного
+# json.dumps с indent — секция всё равно ничего не скажет модели.
+def _has_content(v: Any) -> bool:
+    if isinstance(v, str):
+        return bool(v.strip())
+    if isinstance(v, dict):
+        return any(_has_content(x) for x in v.values())
+    if isinstance(v, (list, tuple)):
+        return any(_has_content(x) for x in v)
+    return v is not None
+
+
+def _first_of(d: Dict[str, Any], keys: tuple) -> str:
+    for k in keys:
+        v = d.get(k)
+        if isinstance(v, str):
+            s = _clean_str(v)
+            if s:
+                return s
+    return ""
+
 
 class ResumeAnalyzerError(RuntimeError):
     pass
@@ -29,6 +148,31 @@ class ResumeAnalyzer:
       - strict JSON output validated by Pydantic
     """
 
+    # Constant prompt scaffolding shared by every prepare_prompt call.
+    _USER_PREFIX = (
+        "Ось дані для аналізу. Оціни кандидата суворо за алгоритмом.\n\n"
+        "ВИМОГИ ДО КАНДИДАТА (criteria_bundle):\n"
+    )
+
+    # Весь статический каркас user-сообщения заморожен в одном шаблоне:
+    # prepare_prompt делает один .format вместо цепочки конкатенаций.
+    _USER_PROMPT_TEMPLATE = _USER_PREFIX + (
+        "{criteria_json}\n\n"
+        "ПРОФІЛЬ КАНДИДАТА (resume_content):\n"
+        "<resume_content>\n"
+        "{resume_text}\n"
+        "</resume_content>\n"
+    )
+
+    # Скільки резюме пакуємо в один запит до LLM у analyze_batch.
+    BATCH_SIZE = 6
+
+    _BATCH_INSTRUCTION = (
+        "\nПоверни СТРОГО JSON-масив: по одному об'єкту на кожен блок "
+        '<resume_content>, з додатковим полем "id", що дорівнює атрибуту '
+        "id відповідного блока. Жодного тексту поза масивом.\n"
+    )
+
     def __init__(
         self,
         llm_chat: Callable[[Sequence[Dict[str, str]]], str],
@@ -36,6 +180,16 @@ class ResumeAnalyzer:
     ) -> None:
         self._llm_chat = llm_chat
         self._system_prompt = system_prompt.strip()
+        # Системное сообщение неизменно — собираем dict один раз,
+        # а не на каждый prepare_prompt в батче.
+        self._system_msg = {"role": "system", "content": self._system_prompt}
+        # Один и тот же criteria_bundle сериализуется для сотен резюме
+        # батча — кешируем JSON по id() последнего объекта.
+        self._criteria_json_cache: tuple[int, str] = (0, "")
+        # Собранный текст резюме по стабильному resume id: при ретраях
+        # analyze (сбой LLM, невалидный ответ) не пересобираем секции
+        # и не гоняем json.dumps по тем же спискам повторно.
+        self._resume_text_cache: Dict[str, str] = {}
 
     # -----------------
     # Public API
@@ -44,6 +198,85 @@ class ResumeAnalyzer:
     def analyze(
         self, resume_json: Dict[str, Any], criteria_bundle: Dict[str, Any]
     ) -> Optional[AnalysisResult]:
+        pre = self._pre_screen(resume_json)
+        if pre is not _NO_SHORT_CIRCUIT:
+            return pre
+
+        # Диагностика: логируем resume_content для отладки
+        messages = self.prepare_prompt(
+            resume_json=resume_json, criteria_bundle=criteria_bundle
+        )
+        resume_text = self._optimize_resume_data(resume_json)
+        logger.info(f"Resume content length: {len(resume_text)} characters")
+
+        if not resume_text or resume_text == "NO_RESUME_TEXT_AVAILABLE":
+            logger.warning(
+                f"Empty resume_content after optimization: {resume_json.get('url', 'UNKNOWN_URL')}"
+            )
+            return None  # Пропускаем резюме
+
+        raw = self.call_llm(messages)
+        return self.parse_response(raw)
+
+    def analyze_batch(
+        self,
+        resumes: Sequence[Dict[str, Any]],
+        criteria_bundle: Dict[str, Any],
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Batch analysis: pack up to BATCH_SIZE resumes into one LLM call.
+
+        The criteria + rules prefix (1-2K tokens) is sent once per chunk
+        instead of once per resume, cutting tokens-in and round-trips
+        proportionally. Returns results aligned with the input order;
+        None marks resumes that were skipped (empty) or missing from the
+        LLM's answer.
+        """
+        results: List[Optional[AnalysisResult]] = [None] * len(resumes)
+        # (индекс в исходном списке, готовый resume_content)
+        pending: List[tuple[int, str]] = []
+
+        for i, resume_json in enumerate(resumes):
+            pre = self._pre_screen(resume_json)
+            if pre is not _NO_SHORT_CIRCUIT:
+                results[i] = pre
+                continue
+            text = self._sanitize_text(
+                self._optimize_resume_data(resume_json)
+            )
+            if not text or text == "NO_RESUME_TEXT_AVAILABLE":
+                logger.warning(
+                    f"Empty resume_content after optimization: {resume_json.get('url', 'UNKNOWN_URL')}"  # noqa: E501
+                )
+                continue
+            pending.append((i, text))
+
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            chunk = pending[start:start + self.BATCH_SIZE]
+            messages = self._prepare_batch_prompt(chunk, criteria_bundle)
+            raw = self.call_llm(messages)
+            parsed = self._parse_batch_response(raw, count=len(chunk))
+            for j, (orig_idx, _text) in enumerate(chunk):
+                item = parsed.get(j)
+                if item is None:
+                    logger.warning(
+                        f"Batch response missing resume id={j} "
+                        f"(input index {orig_idx})"
+                    )
+                results[orig_idx] = item
+
+        return results
+
+    # -----------------
+    # Step 1: Prompt
+    # -----------------
+
+    def _pre_screen(self, resume_json: Dict[str, Any]) -> Any:
+        """
+        Cheap checks shared by analyze/analyze_batch, run before any LLM
+        work. Returns a ready AnalysisResult (protected resume), None
+        (skip resume entirely) or _NO_SHORT_CIRCUIT (send to LLM).
+        """
         # ПРОВЕРКА 1: Защищённое резюме (требуется авторизация)
         page_type = resume_json.get("page_type", "").upper()
         if page_type in ("LOGIN", "PROTECTED"):
@@ -77,25 +310,17 @@ class ResumeAnalyzer:
             )
             return None  # Пропускаем резюме полностью
 
-        # Диагностика: логируем resume_content для отладки
-        messages = self.prepare_prompt(
-            resume_json=resume_json, criteria_bundle=criteria_bundle
-        )
-        resume_text = self._optimize_resume_data(resume_json)
-        logger.info(f"Resume content length: {len(resume_text)} characters")
-
-        if not resume_text or resume_text == "NO_RESUME_TEXT_AVAILABLE":
-            logger.warning(
-                f"Empty resume_content after optimization: {resume_json.get('url', 'UNKNOWN_URL')}"
-            )
-            return None  # Пропускаем резюме
+        return _NO_SHORT_CIRCUIT
 
-        raw = self.call_llm(messages)
-        return self.parse_response(raw)
-
-    # -----------------
-    # Step 1: Prompt
-    # -----------------
+    def _criteria_json(self, criteria_bundle: Dict[str, Any]) -> str:
+        # IMPORTANT: criteria_bundle may contain internal fields; we pass it as-is,
+        # but we do NOT embed any HTML or raw resume objects.
+        cid = id(criteria_bundle)
+        if self._criteria_json_cache[0] == cid:
+            return self._criteria_json_cache[1]
+        criteria_json = _dumps_indent(criteria_bundle)
+        self._criteria_json_cache = (cid, criteria_json)
+        return criteria_json
 
     def prepare_prompt(
         self, resume_json: Dict[str, Any], criteria_bundle: Dict[str, Any]
@@ -103,25 +328,38 @@ class ResumeAnalyzer:
         resume_text = self._optimize_resume_data(resume_json)
         resume_text = self._sanitize_text(resume_text)
 
-        # IMPORTANT: criteria_bundle may contain internal fields; we pass it as-is,
-        # but we do NOT embed any HTML or raw resume objects.
-        criteria_payload = criteria_bundle
-
-        user_content = (
-            "Ось дані для аналізу. Оціни кандидата суворо за алгоритмом.\n\n"
-            "ВИМОГИ ДО КАНДИДАТА (criteria_bundle):\n"
-            f"{json.dumps(criteria_payload, ensure_ascii=False, indent=2)}\n\n"
-            "ПРОФІЛЬ КАНДИДАТА (resume_content):\n"
-            "<resume_content>\n"
-            f"{resume_text}\n"
-            "</resume_content>\n"
+        user_content = self._USER_PROMPT_TEMPLATE.format(
+            criteria_json=self._criteria_json(criteria_bundle),
+            resume_text=resume_text,
         )
 
         return [
-            {"role": "system", "content": self._system_prompt},
+            self._system_msg,
             {"role": "user", "content": user_content},
         ]
 
+    def _prepare_batch_prompt(
+        self,
+        chunk: Sequence[tuple],
+        criteria_bundle: Dict[str, Any],
+    ) -> List[Dict[str, str]]:
+        buf = io.StringIO()
+        buf.write(self._USER_PREFIX)
+        buf.write(self._criteria_json(criteria_bundle))
+        buf.write("\n\nПРОФІЛІ КАНДИДАТІВ (resume_content):\n")
+        # id блока — позиция внутри чанка; обратно в индексы входного
+        # списка их переводит analyze_batch.
+        for j, (_orig_idx, text) in enumerate(chunk):
+            buf.write(f'<resume_content id="{j}">\n')
+            buf.write(text)
+            buf.write("\n</resume_content>\n")
+        buf.write(self._BATCH_INSTRUCTION)
+
+        return [
+            self._system_msg,
+            {"role": "user", "content": buf.getvalue()},
+        ]
+
     # -----------------
     # Step 2: LLM call
     # -----------------
@@ -150,13 +388,50 @@ class ResumeAnalyzer:
                 "LLM did not return a valid JSON object. Expected a single JSON object for AnalysisResult."
             )
 
+        # Fast path: форма проверена вручную — model_construct без полного
+        # прохода pydantic-core. model_validate остаётся для остального.
+        if _matches_analysis_shape(obj):
+            return AnalysisResult.model_construct(**obj)
+
         try:
-            return AnalysisResult.model_validate(obj)
+            return _ANALYSIS_ADAPTER.validate_python(obj)
         except ValidationError as ve:
             raise LLMResponseFormatError(
                 f"LLM returned JSON but it does not match AnalysisResult schema: {ve}"
             ) from ve
 
+    def _parse_batch_response(
+        self, raw_text: str, count: int
+    ) -> Dict[int, AnalysisResult]:
+        """Map block id -> AnalysisResult from a batch (array) response."""
+        arr = self._extract_first_json_array(raw_text)
+        if arr is None:
+            logger.error(
+                f"Failed to extract JSON array from batch LLM response. First 1000 chars: {raw_text[:1000]}"  # noqa: E501
+            )
+            raise LLMResponseFormatError(
+                "LLM did not return a valid JSON array for batch analysis."
+            )
+
+        out: Dict[int, AnalysisResult] = {}
+        for item in arr:
+            if not isinstance(item, dict):
+                continue
+            rid = item.get("id")
+            if not isinstance(rid, int) or not (0 <= rid < count):
+                continue
+            # Лишний ключ "id" и model_construct, и extra=ignore отбросят.
+            if _matches_analysis_shape(item):
+                out[rid] = AnalysisResult.model_construct(**item)
+                continue
+            try:
+                out[rid] = _ANALYSIS_ADAPTER.validate_python(item)
+            except ValidationError as ve:
+                logger.error(
+                    f"Batch item id={rid} does not match AnalysisResult schema: {ve}"  # noqa: E501
+                )
+        return out
+
     # =================
     # Pre-processing
     # =================
@@ -175,10 +450,22 @@ class ResumeAnalyzer:
         if isinstance(payload, dict):
             resume_json = payload
 
-        # -------------------------
-        # 1) Structured components
-        # -------------------------
-        structured_parts: list[str] = []
+        # Кеш только по стабильному id резюме: id(dict) после сборки
+        # мусора может достаться другому объекту, рисковать не будем.
+        raw_id = resume_json.get("id") or resume_json.get("resume_id")
+        cache_key = str(raw_id) if raw_id else None
+        if cache_key is not None:
+            cached = self._resume_text_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Композит пишем в один StringIO: большие блоки (about_raw —
+        # целиком загруженное CV) копируются один раз в буфер вместо
+        # каскада join'ов по промежуточным спискам.
+        buf = io.StringIO()
+        write = buf.write
+        wrote_structured = False
+        wrote_full = False
 
         def _first_nonempty_str(*keys: str) -> str:
             for k in keys:
@@ -187,6 +474,20 @@ class ResumeAnalyzer:
                     return v.strip()
             return ""
 
+        # -------------------------
+        # 1) Structured components
+        # -------------------------
+        def _emit_section(name: str, body: str) -> None:
+            nonlocal wrote_structured
+            if not wrote_structured:
+                write("=== STRUCTURED ===\n")
+                wrote_structured = True
+            else:
+                write("\n\n")
+            write(name)
+            write(":\n")
+            write(body)
+
         position = _first_nonempty_str("title", "position", "candidate_title")
 
         # Доп. ролі, які кандидат розглядає (ми зберігаємо їх у payload як considered_positions)
@@ -206,23 +507,16 @@ class ResumeAnalyzer:
             position_lines.append("Розглядає посади: " + considered.strip())
 
         if position_lines:
-            structured_parts.append("POSITION:\n" + "\n".join(position_lines) + "\n")
+            _emit_section("POSITION", "\n".join(position_lines))
 
         def _add_section(name: str, value: Any) -> None:
             if value is None:
                 return
             if isinstance(value, str) and value.strip():
-                structured_parts.append(f"{name}:\n{value.strip()}")
+                _emit_section(name, value.strip())
                 return
-            if isinstance(value, list) and value:
-                structured_parts.append(
-                    f"{name}:\n{json.dumps(value, ensure_ascii=False, indent=2)}"
-                )
-                return
-            if isinstance(value, dict) and value:
-                structured_parts.append(
-                    f"{name}:\n{json.dumps(value, ensure_ascii=False, indent=2)}"
-                )
+            if isinstance(value, (list, dict)) and _has_content(value):
+                _emit_section(name, _dumps_indent(value))
                 return
 
         _add_section("SKILLS", resume_json.get("skills"))
@@ -231,45 +525,41 @@ class ResumeAnalyzer:
         _add_section("LANGUAGES", resume_json.get("languages"))
         _add_section("CERTIFICATIONS", resume_json.get("certifications"))
 
-        structured_text = "\n\n".join(structured_parts).strip()
-
         # -------------------------
         # 2) Full-text components
         # -------------------------
         # Critical: Work.ua “uploaded file / quick view” lives in about_raw
-        full_text_fields = [
-            "about_raw",  # ✅ key you confirmed exists and contains full text
-            "full_text",
-            "raw_text",
-            "content",
-            "description",
-            "text",
-            "version_for_quick_view",
-            "quick_view",
-            "summary",
-        ]
-
-        full_chunks: list[str] = []
-        for k in full_text_fields:
-            v = resume_json.get(k)
-            if isinstance(v, str) and v.strip():
-                full_chunks.append(f"[{k}]\n{v.strip()}")
-
-        full_text = "\n\n".join(full_chunks).strip()
-
-        # -------------------------
-        # 3) Final composite
-        # -------------------------
-        final_parts: list[str] = []
-        if structured_text:
-            final_parts.append("=== STRUCTURED ===\n" + structured_text)
-        if full_text:
-            # ВАЖНО: "about_raw" — это ОСНОВНОЙ блок опыта кандидата (uploaded CV)
-            final_parts.append(
-                "=== CANDIDATE EXPERIENCE SUMMARY (PRIMARY SOURCE) ===\n" + full_text
-            )
-
-        return "\n\n".join(final_parts) if final_parts else "NO_RESUME_TEXT_AVAILABLE"
+        # ВАЖНО: "about_raw" — это ОСНОВНОЙ блок опыта кандидата (uploaded CV)
+        # Локальный биндинг get + один strip на поле (у большинства резюме
+        # заполнен только about_raw, остальные lookups — промахи).
+        get = resume_json.get
+        for k in _FULL_TEXT_FIELDS:
+            v = get(k)
+            if isinstance(v, str) and (vs := v.strip()):
+                if not wrote_full:
+                    if wrote_structured:
+                        write("\n\n")
+                    write(
+                        "=== CANDIDATE EXPERIENCE SUMMARY (PRIMARY SOURCE) ===\n"  # noqa: E501
+                    )
+                    wrote_full = True
+                else:
+                    write("\n\n")
+                write(f"[{k}]\n")
+                write(vs)
+
+        text = (
+            buf.getvalue()
+            if (wrote_structured or wrote_full)
+            else "NO_RESUME_TEXT_AVAILABLE"
+        )
+        if cache_key is not None:
+            cache = self._resume_text_cache
+            cache[cache_key] = text
+            if len(cache) > _RESUME_TEXT_CACHE_MAX:
+                # FIFO: dict хранит порядок вставки, выкидываем старейший
+                del cache[next(iter(cache))]
+        return text
 
     def _sanitize_text(self, text: str) -> str:
         """
@@ -282,22 +572,14 @@ class ResumeAnalyzer:
             return text
 
         # Remove ASCII control chars except \n and \t
-        text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
+        text = text.translate(_CTRL_TRANS)
 
         # Collapse excessive whitespace (but keep newlines for structure)
-        text = re.sub(r"[ \t]{2,}", " ", text)
+        text = _WS_RUN_RE.sub(" ", text)
 
         # Basic prompt-injection hardening: neutralize common role markers if present in resume
         # (resume must be treated as data, not instructions)
-        text = text.replace("<system>", "&lt;system&gt;").replace(
-            "</system>", "&lt;/system&gt;"
-        )
-        text = text.replace("<assistant>", "&lt;assistant&gt;").replace(
-            "</assistant>", "&lt;/assistant&gt;"
-        )
-        text = text.replace("<user>", "&lt;user&gt;").replace(
-            "</user>", "&lt;/user&gt;"
-        )
+        text = _ROLE_TAG_RE.sub(_escape_role_tag, text)
 
         return text.strip()
 
@@ -315,13 +597,28 @@ class ResumeAnalyzer:
     def _pick_skills(self, resume_json: Dict[str, Any]) -> List[str]:
         v = resume_json.get("skills")
         if isinstance(v, list):
-            out = [self._to_clean_str(x) for x in v if self._to_clean_str(x)]
-            return out[:60]  # token safety
+            # token safety: останавливаемся на 60-м навыке, хвост длинных
+            # списков не чистим и не аллоцируем; _to_clean_str — один
+            # вызов на элемент вместо двух в старом comprehension.
+            clean = self._to_clean_str
+            return list(
+                islice((c for c in map(clean, v) if c), 60)
+            )
         if isinstance(v, str) and v.strip():
-            # split by common delimiters
-            chunks = re.split(r"[,;•\n]+", v)
-            out = [c.strip() for c in chunks if c.strip()]
-            return out[:60]
+            # split by common delimiters (lazily, via finditer)
+            return list(
+                islice(
+                    (
+                        c
+                        for c in (
+                            m.group(0).strip()
+                            for m in _SKILL_TOKEN_RE.finditer(v)
+                        )
+                        if c
+                    ),
+                    60,
+                )
+            )
         return []
 
     def _pick_experience(self, resume_json: Dict[str, Any]) -> List[str]:
@@ -330,15 +627,13 @@ class ResumeAnalyzer:
             return []
 
         blocks: List[str] = []
-        for i, item in enumerate(v[:12]):  # limit
+        for i, item in enumerate(islice(v, 12)):  # limit
             if not isinstance(item, dict):
                 continue
-            role = self._to_clean_str(
-                item.get("position") or item.get("title") or item.get("role")
-            )
+            role = _first_of(item, _EXP_ROLE_KEYS)
             company = self._to_clean_str(item.get("company"))
-            period = self._to_clean_str(item.get("period") or item.get("dates"))
-            desc = self._to_clean_str(item.get("description") or item.get("details"))
+            period = _first_of(item, _PERIOD_KEYS)
+            desc = _first_of(item, _DESC_KEYS)
 
             header_parts = [p for p in [role, company, period] if p]
             header = " — ".join(header_parts) if header_parts else f"Experience #{i+1}"
@@ -354,12 +649,12 @@ class ResumeAnalyzer:
             return []
 
         blocks: List[str] = []
-        for i, item in enumerate(v[:8]):  # limit
+        for i, item in enumerate(islice(v, 8)):  # limit
             if not isinstance(item, dict):
                 continue
-            degree = self._to_clean_str(item.get("degree") or item.get("title"))
-            school = self._to_clean_str(item.get("institution") or item.get("school"))
-            period = self._to_clean_str(item.get("period") or item.get("dates"))
+            degree = _first_of(item, _EDU_DEGREE_KEYS)
+            school = _first_of(item, _EDU_SCHOOL_KEYS)
+            period = _first_of(item, _PERIOD_KEYS)
             desc = self._to_clean_str(item.get("description"))
 
             header_parts = [p for p in [degree, school, period] if p]
@@ -372,7 +667,7 @@ class ResumeAnalyzer:
 
     def _to_clean_str(self, v: Any) -> str:
         if isinstance(v, str):
-            return v.strip()
+            return _clean_str(v)
         return ""
 
     # =================
@@ -384,42 +679,49 @@ class ResumeAnalyzer:
         if not text:
             return None
 
-        # 1) whole-text JSON
+        # 1) whole-text JSON (orjson отклоняет хвостовой мусор, поэтому
+        # при неудаче честно падаем в сканер ниже)
         try:
-            parsed = json.loads(text)
+            parsed = orjson.loads(text) if orjson is not None else json.loads(text)
             return parsed if isinstance(parsed, dict) else None
         except Exception:
             pass
 
-        # 2) scan for balanced {...}
-        start = text.find("{")
-        if start == -1:
+        # 2) let the C-implemented decoder find the balanced object:
+        # raw_decode parses from an offset and returns the end index,
+        # replacing the old per-character depth/in_str/escape loop.
+        decoder = json.JSONDecoder()
+        i = text.find("{")
+        while i != -1:
+            try:
+                parsed, _end = decoder.raw_decode(text, i)
+            except json.JSONDecodeError:
+                pass
+            else:
+                return parsed if isinstance(parsed, dict) else None
+            i = text.find("{", i + 1)
+        return None
+
+    def _extract_first_json_array(self, text: str) -> Optional[List[Any]]:
+        # Зеркало _extract_first_json_object для батч-ответов (массив).
+        text = (text or "").strip()
+        if not text:
             return None
 
-        depth = 0
-        in_str = False
-        escape = False
-        for i in range(start, len(text)):
-            ch = text[i]
-            if in_str:
-                if escape:
-                    escape = False
-                elif ch == "\\":
-                    escape = True
-                elif ch == '"':
-                    in_str = False
+        try:
+            parsed = orjson.loads(text) if orjson is not None else json.loads(text)
+            return parsed if isinstance(parsed, list) else None
+        except Exception:
+            pass
+
+        decoder = json.JSONDecoder()
+        i = text.find("[")
+        while i != -1:
+            try:
+                parsed, _end = decoder.raw_decode(text, i)
+            except json.JSONDecodeError:
+                pass
             else:
-                if ch == '"':
-                    in_str = True
-                elif ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        candidate = text[start : i + 1]  # noqa: E203
-                        try:
-                            parsed = json.loads(candidate)
-                            return parsed if isinstance(parsed, dict) else None
-                        except Exception:
-                            return None
+                return parsed if isinstance(parsed, list) else None
+            i = text.find("[", i + 1)
         return None
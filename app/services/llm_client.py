@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-import json
 import logging
-from typing import Dict, Sequence
+from typing import Dict, List, Sequence
 from tenacity import (
+    AsyncRetrying,
     retry,
     stop_after_attempt,
     wait_exponential,
@@ -24,6 +26,14 @@ class RealLLMNotConfigured(RuntimeError):
     pass
 
 
+# genai.Client поднимает собственный HTTP-клиент — создавать его на каждый
+# вызов дорого и теряет connection pool. Мемоизируем по ключу: смена
+# GEMINI_API_KEY в окружении всё ещё даёт новый клиент.
+@functools.lru_cache(maxsize=4)
+def _build_client(api_key: str) -> genai.Client:
+    return genai.Client(api_key=api_key)
+
+
 def _get_client() -> genai.Client:
     """Читает ключ и возвращает настроенный клиент."""
     api_key = os.getenv("GEMINI_API_KEY")
@@ -31,7 +41,7 @@ def _get_client() -> genai.Client:
         raise RealLLMNotConfigured(
             "❌ GEMINI_API_KEY not found in environment variables."
         )
-    return genai.Client(api_key=api_key)
+    return _build_client(api_key)
 
 
 # Настройка Retry: ловимо нову помилку APIError
@@ -50,13 +60,33 @@ def _call_gemini_with_retry(
     return response.text
 
 
-def real_llm_chat(messages: Sequence[Dict[str, str]]) -> str:
-    """
-    Отправляет запрос в Google Gemini.
-    Гарантирует возврат JSON (response_mime_type='application/json').
-    """
-    client = _get_client()
-
+# --- ЗНІМАЄМО ЦЕНЗУРУ (Новий синтаксис google-genai) ---
+# Налаштування незмінні між викликами — тримаємо один список на модуль,
+# а не будуємо чотири об'єкти SafetySetting на кожен запит.
+_SAFETY_SETTINGS = [
+    types.SafetySetting(
+        category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+        threshold=types.HarmBlockThreshold.BLOCK_NONE,
+    ),
+    types.SafetySetting(
+        category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+        threshold=types.HarmBlockThreshold.BLOCK_NONE,
+    ),
+    types.SafetySetting(
+        category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+        threshold=types.HarmBlockThreshold.BLOCK_NONE,
+    ),
+    types.SafetySetting(
+        category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+        threshold=types.HarmBlockThreshold.BLOCK_NONE,
+    ),
+]
+
+
+def _prepare_request(
+    messages: Sequence[Dict[str, str]],
+) -> tuple[str, types.GenerateContentConfig]:
+    """Собирает user_content и конфиг запроса из chat-сообщений."""
     system_instruction = ""
     user_content = ""
 
@@ -68,42 +98,99 @@ def real_llm_chat(messages: Sequence[Dict[str, str]]) -> str:
         elif role == "user":
             user_content += content + "\n"
 
-    # --- ЗНІМАЄМО ЦЕНЗУРУ (Новий синтаксис google-genai) ---
-    safety_settings = [
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-    ]
-
     # Створюємо об'єкт конфігурації за новими правилами google-genai
     config = types.GenerateContentConfig(
         system_instruction=system_instruction if system_instruction else None,
         response_mime_type="application/json",
         temperature=0.2,
-        safety_settings=safety_settings,  # <--- ДОДАЛИ НАЛАШТУВАННЯ СЮДИ
+        safety_settings=_SAFETY_SETTINGS,
     )
+    return user_content, config
+
+
+def _ensure_json_shaped(raw_response: str) -> None:
+    """
+    Дешёвая структурная проверка ответа вместо полного json.loads:
+    распарсенный объект всё равно выбрасывался, а настоящий разбор (с
+    обработкой ошибок) делает вызывающая сторона. Gemini с
+    response_mime_type='application/json' возвращает объект или массив.
+    """
+    stripped = raw_response.strip() if raw_response else ""
+    if not (
+        (stripped.startswith("{") and stripped.endswith("}"))
+        or (stripped.startswith("[") and stripped.endswith("]"))
+    ):
+        raise ValueError("LLM response does not look like JSON")
+
+
+def real_llm_chat(messages: Sequence[Dict[str, str]]) -> str:
+    """
+    Отправляет запрос в Google Gemini.
+    Гарантирует возврат JSON (response_mime_type='application/json').
+    """
+    client = _get_client()
+    user_content, config = _prepare_request(messages)
 
     try:
         logger.info("Sending request to Gemini...")
         raw_response = _call_gemini_with_retry(client, user_content, config)
 
-        json.loads(raw_response)
+        _ensure_json_shaped(raw_response)
+
+        return raw_response
+
+    except Exception as e:
+        logger.error(f"Gemini API Error: {e}")
+        raise e
+
+
+# Не больше 8 одновременных запросов к Gemini: скрываем сетевую задержку,
+# но не упираемся в rate limit. Семафор на модуль — лимит общий для всех
+# конкурентных вызовов areal_llm_chat.
+_LLM_CONCURRENCY = 8
+_llm_semaphore = asyncio.Semaphore(_LLM_CONCURRENCY)
+
+
+async def _acall_gemini_with_retry(
+    client: genai.Client, user_content: str, config: types.GenerateContentConfig
+) -> str:
+    # Та же retry-политика, что и в _call_gemini_with_retry, но через
+    # AsyncRetrying: декоратор @retry блокировал бы event loop на wait.
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(APIError),
+        reraise=True,
+    ):
+        with attempt:
+            response = await client.aio.models.generate_content(
+                model="gemini-2.5-pro", contents=user_content, config=config
+            )
+            return response.text
+
+
+async def areal_llm_chat(
+    batch: Sequence[Sequence[Dict[str, str]]],
+) -> List[str]:
+    """
+    Асинхронный батчевый аналог real_llm_chat: отправляет несколько
+    запросов в Gemini конкурентно (ограничено семафором) и возвращает
+    ответы в порядке входного батча.
+    """
+    client = _get_client()
 
+    async def _one(messages: Sequence[Dict[str, str]]) -> str:
+        user_content, config = _prepare_request(messages)
+        async with _llm_semaphore:
+            logger.info("Sending request to Gemini...")
+            raw_response = await _acall_gemini_with_retry(
+                client, user_content, config
+            )
+        _ensure_json_shaped(raw_response)
         return raw_response
 
+    try:
+        return list(await asyncio.gather(*(_one(m) for m in batch)))
     except Exception as e:
         logger.error(f"Gemini API Error: {e}")
         raise e
@@ -7,11 +7,28 @@ from typing import Any, Dict, Optional
 # Імпортуємо тільки AnalysisResult (Verdict більше не існує)
 from app.models.agent import AnalysisResult
 
+# orjson парсить JSON у C — помітно швидше stdlib на великих дампах
+# резюме/аналізів; без нього прозоро відкатуємось на json.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - середовище без orjson
+    orjson = None
+
 
 class ReportGeneratorError(RuntimeError):
     pass
 
 
+# Статичні мапи статусів "Світлофора" — на рівні модуля, щоб не будувати
+# dict на кожен виклик generate.
+_STATUS_EMOJI = {"GREEN": "🟢", "YELLOW": "🟡", "RED": "🔴"}
+_STATUS_SECTION = {
+    "GREEN": "\n**Повна відповідність:**",
+    "YELLOW": "\n**Ризики / Чого бракує:**",
+    "RED": "\n**Чому не підходить:**",
+}
+
+
 @dataclass(frozen=True)
 class ReportGenerator:
     """
@@ -30,10 +47,10 @@ class ReportGenerator:
             return self._generate_error_block(title, url, "Помилка аналізу LLM")
 
         # 2. Захист: закриті контакти / авторизація
-        if (
-            "обмежений" in analysis.reasoning.lower()
-            or "авторизація" in analysis.reasoning.lower()
-        ):
+        # casefold один раз: два .lower() поспіль — це два повних проходи
+        # Unicode-таблицею по тому самому reasoning.
+        reasoning_cf = analysis.reasoning.casefold()
+        if "обмежений" in reasoning_cf or "авторизація" in reasoning_cf:
             return self._generate_protected_block(title, url)
 
         # 3. Перевірка на "порожню сторінку" (за новою канонічною моделлю)
@@ -62,31 +79,25 @@ class ReportGenerator:
             return self._generate_error_block(title, url, "Дані відсутні на сторінці.")
 
         # 4. Рендеринг нормального звіту за статусами "Світлофора"
-        status_map = {"GREEN": "🟢", "YELLOW": "🟡", "RED": "🔴"}
-
         # Беремо дані з аналізу (вони пріоритетні), або фолбек на json
         cand_title = getattr(analysis, "candidate_role", title)
         cand_url = getattr(analysis, "candidate_url", url)
         status = getattr(analysis, "status", "RED")
-        verdict_emoji = status_map.get(status, "🔴")
+        verdict_emoji = _STATUS_EMOJI.get(status, "🔴")
 
-        md: list[str] = []
-        md.append(f"## {cand_title}")
-        md.append("")
-        md.append(
+        md: list[str] = [
+            f"## {cand_title}",
+            "",
             f"[Посилання на резюме]({cand_url})"
             if cand_url
-            else "[Посилання на резюме](#)"
-        )
-        md.append("")
-        md.append(f"**Вердикт:** {verdict_emoji}")
+            else "[Посилання на резюме](#)",
+            "",
+            f"**Вердикт:** {verdict_emoji}",
+        ]
 
-        if status == "GREEN":
-            md.append("\n**Повна відповідність:**")
-        elif status == "YELLOW":
-            md.append("\n**Ризики / Чого бракує:**")
-        elif status == "RED":
-            md.append("\n**Чому не підходить:**")
+        section = _STATUS_SECTION.get(status)
+        if section:
+            md.append(section)
 
         # Виводимо єдине поле reasoning замість старих evidence/missing
         md.append(getattr(analysis, "reasoning", ""))
@@ -169,8 +180,11 @@ class ReportGenerator:
 
     def _load_json(self, path: str) -> Dict[str, Any]:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Читаємо байтами: orjson приймає bytes напряму, а json.loads —
+            # теж, тож декодування utf-8 робить парсер, а не Python-цикл.
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             if not isinstance(data, dict):
                 raise ReportGeneratorError(f"JSON must be an object: {path}")
             return data
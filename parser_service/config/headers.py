@@ -1,5 +1,5 @@
 import random
-from typing import Dict
+from typing import Dict, Tuple
 
 # Базовые заголовки.
 # ВАЖНО: Мы НЕ указываем "Accept-Encoding".
@@ -25,10 +25,9 @@ USER_AGENTS = [
 ]
 
 
-def get_headers() -> Dict[str, str]:
-    """Генерирует заголовки со случайным User-Agent."""
+def _build_headers_for(user_agent: str) -> Dict[str, str]:
+    """Собирает полный набор заголовков для конкретного User-Agent."""
     headers = BASE_HEADERS.copy()
-    user_agent = random.choice(USER_AGENTS)
     headers["User-Agent"] = user_agent
 
     if "Chrome" in user_agent:
@@ -41,4 +40,20 @@ def get_headers() -> Dict[str, str]:
         elif "Windows" in user_agent:
             headers["Sec-Ch-Ua-Platform"] = '"Windows"'
 
-    return headers
\ No newline at end of file
+    return headers
+
+
+# Готовые наборы заголовков собираются один раз при импорте:
+# на каждый вызов остаётся только random.choice + копия словаря.
+_PREBUILT_HEADERS: Tuple[Dict[str, str], ...] = tuple(
+    _build_headers_for(ua) for ua in USER_AGENTS
+)
+
+# Свой генератор вместо общего random.* — без конкуренции
+# за разделяемое состояние Mersenne Twister.
+_HDR_RNG = random.Random()
+
+
+def get_headers() -> Dict[str, str]:
+    """Генерирует заголовки со случайным User-Agent."""
+    return dict(_HDR_RNG.choice(_PREBUILT_HEADERS))
@@ -1,10 +1,22 @@
 import json
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import Any, FrozenSet, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import orjson
+
+    def _load_json_file(path: Path) -> Any:
+        return orjson.loads(path.read_bytes())
+
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _load_json_file(path: Path) -> Any:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
 
 class ParserSettings(BaseSettings):
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
@@ -22,6 +34,11 @@ class ParserSettings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
 
+    @cached_property
+    def retry_http_codes_set(self) -> FrozenSet[int]:
+        """RETRY_HTTP_CODES как frozenset для O(1) membership на hot path."""
+        return frozenset(self.RETRY_HTTP_CODES)
+
     @property
     def get_proxy_list(self) -> List[str]:
         if not self.PROXY_LIST_STR:
@@ -29,6 +46,10 @@ class ParserSettings(BaseSettings):
         return [p.strip() for p in self.PROXY_LIST_STR.split(",") if p.strip()]
 
     def load_filters_map(self, source: str = "workua") -> dict[str, Any]:
+        # Карты фильтров статичны — читаем и парсим файл один раз на источник.
+        cached = self._filters_cache.get(source)
+        if cached is not None:
+            return cached
         path = (
             self.WORKUA_FILTERS_PATH
             if source == "workua"
@@ -36,8 +57,13 @@ class ParserSettings(BaseSettings):
         )
         if not path.exists():
             raise FileNotFoundError(f"Filters map for {source} not found at {path}")
-        with open(path, "r", encoding="utf-8") as file:
-            return json.load(file)
+        filters_map = _load_json_file(path)
+        self._filters_cache[source] = filters_map
+        return filters_map
+
+    @cached_property
+    def _filters_cache(self) -> dict[str, dict[str, Any]]:
+        return {}
 
 
 @lru_cache
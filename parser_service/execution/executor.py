@@ -1,13 +1,6 @@
 import logging
 import httpx
-from typing import Callable, Awaitable, Any, List
-from tenacity import (
-    AsyncRetrying,
-    stop_after_attempt,
-    wait_random_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-)
+from typing import AbstractSet, Callable, Awaitable, Any
 
 from parser_service.core.exceptions import (
     TransportError,
@@ -21,56 +14,94 @@ from parser_service.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-def _classify_httpx_error(e: Exception, retry_codes: List[int]) -> Exception:
+def _classify_status_error(
+    e: httpx.HTTPStatusError, retry_codes: AbstractSet[int]
+) -> Exception:
+    """Ошибки статуса (ответ получен)."""
+    status = e.response.status_code
+
+    # 403 -> Сигнал "Смени прокси/IP" (Permanent)
+    if status == 403:
+        return ProxyBanError(f"HTTP 403 Forbidden: {e}")
+
+    # 401 -> Auth Error (Domain)
+    if status == 401:
+        return AuthError(status, str(e))
+
+    # 400 -> Bad Request (Domain, например кривой url/headers)
+    if status == 400:
+        return DomainError(status, f"Bad Request: {e}")
+
+    # Transient Codes (429, 5xx) -> Retry
+    if status in retry_codes:
+        return TransientError(f"HTTP {status} - Transient")
+
+    # 404, 410, etc -> Domain Error
+    return DomainError(status, str(e))
+
+
+# Диспетчеризация "класс исключения -> обработчик" вместо isinstance-цепочки.
+# Порядок не важен: поиск идёт по MRO исключения, поэтому более специфичные
+# классы (ConnectError/ProxyError) срабатывают раньше общего RequestError.
+#
+# - HTTPStatusError: см. _classify_status_error.
+# - Таймауты: Retry (Transient) — ReadTimeout может случиться и на живом прокси.
+# - ConnectError/ProxyError: Permanent — Executor работает с фиксированным
+#   клиентом (и фиксированным прокси), ретраить бесполезно, прокси не оживет
+#   мгновенно. Мы падаем, чтобы Service Layer взял новый прокси.
+# - Прочие сетевые ошибки (ProtocolError, etc): Transient — иногда бывают
+#   случайные сбросы соединения.
+_HANDLERS = {
+    httpx.HTTPStatusError: _classify_status_error,
+    httpx.TimeoutException: lambda e, rc: TransientError(f"Timeout: {e}"),
+    httpx.ConnectError: lambda e, rc: PermanentTransportError(
+        f"Connection Failed: {e}"
+    ),
+    httpx.ProxyError: lambda e, rc: PermanentTransportError(
+        f"Connection Failed: {e}"
+    ),
+    httpx.RequestError: lambda e, rc: TransientError(f"Network Glitch: {e}"),
+}
+
+
+def _classify_httpx_error(e: Exception, retry_codes: AbstractSet[int]) -> Exception:
     """
     Классификатор ошибок. Определяет стратегию Retry vs Fail Fast.
     """
-    # 1. Ошибки статуса (ответ получен)
-    if isinstance(e, httpx.HTTPStatusError):
-        status = e.response.status_code
-
-        # 403 -> Сигнал "Смени прокси/IP" (Permanent)
-        if status == 403:
-            return ProxyBanError(f"HTTP 403 Forbidden: {e}")
-
-        # 401 -> Auth Error (Domain)
-        if status == 401:
-            return AuthError(status, str(e))
-
-        # 400 -> Bad Request (Domain, например кривой url/headers)
-        if status == 400:
-            return DomainError(status, f"Bad Request: {e}")
-
-        # Transient Codes (429, 5xx) -> Retry
-        if status in retry_codes:
-            return TransientError(f"HTTP {status} - Transient")
-
-        # 404, 410, etc -> Domain Error
-        return DomainError(status, str(e))
-
-    # 2. Ошибки таймаута -> Retry (Transient)
-    # ReadTimeout может случиться и на живом прокси.
-    if isinstance(e, httpx.TimeoutException):
-        return TransientError(f"Timeout: {e}")
-
-    # 3. Ошибки подключения (ConnectError, ProxyError) -> Permanent
-    # Поскольку Executor работает с фиксированным клиентом (и фиксированным прокси),  # noqa: E501
-    # ретраить ConnectError бесполезно - прокси не оживет мгновенно.
-    # Мы падаем, чтобы Service Layer взял новый прокси.
-    if isinstance(e, (httpx.ConnectError, httpx.ProxyError)):
-        return PermanentTransportError(f"Connection Failed: {e}")
-
-    # 4. Прочие сетевые ошибки (ProtocolError, etc) -> Попробуем ретрай (Transient)  # noqa: E501
-    # Иногда бывают случайные сбросы соединения.
-    if isinstance(e, httpx.RequestError):
-        return TransientError(f"Network Glitch: {e}")
+    for cls in type(e).__mro__:
+        handler = _HANDLERS.get(cls)
+        if handler is not None:
+            return handler(e, retry_codes)
 
     return TransportError(f"Unknown: {e}")
 
 
 class RequestExecutor:
     def __init__(self, settings: Any):
+        # Ленивый импорт: tenacity нужен только исполнителям запросов,
+        # модули, импортирующие executor транзитивно, не платят за него
+        # на cold start.
+        from tenacity import (
+            AsyncRetrying,
+            stop_after_attempt,
+            wait_random_exponential,
+            retry_if_exception_type,
+            before_sleep_log,
+        )
+
         self.settings = settings
+        # Конфигурация Retry неизменна для экземпляра — строим стратегии
+        # (stop/wait/retry/before_sleep) один раз, а не на каждый execute.
+        self._retrier = AsyncRetrying(
+            retry=retry_if_exception_type(TransientError),
+            stop=stop_after_attempt(settings.RETRY_MAX_ATTEMPTS),
+            wait=wait_random_exponential(
+                multiplier=settings.RETRY_MIN_WAIT,
+                max=settings.RETRY_MAX_WAIT,
+            ),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )
 
     async def execute(
         self, request_func: Callable[[], Awaitable[httpx.Response]]
@@ -78,16 +109,9 @@ class RequestExecutor:
         """
         Выполняет запрос с политикой Resilience.
         """
-        retrier = AsyncRetrying(
-            retry=retry_if_exception_type(TransientError),
-            stop=stop_after_attempt(self.settings.RETRY_MAX_ATTEMPTS),
-            wait=wait_random_exponential(
-                multiplier=self.settings.RETRY_MIN_WAIT,
-                max=self.settings.RETRY_MAX_WAIT,
-            ),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-            reraise=True,
-        )
+        # copy() разделяет готовые стратегии, но даёт независимое состояние
+        # итерации — один и тот же executor безопасен при конкурентных вызовах.
+        retrier = self._retrier.copy()
 
         try:
             async for attempt in retrier:
@@ -99,7 +123,7 @@ class RequestExecutor:
                     except Exception as e:
                         # Классификация
                         raise _classify_httpx_error(
-                            e, self.settings.RETRY_HTTP_CODES
+                            e, self.settings.retry_http_codes_set
                         )
 
         except Exception as e:
@@ -1,7 +1,6 @@
 import asyncio
 import random
 import logging
-import inspect
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional, Any
 from urllib.parse import urlparse, urlunparse
@@ -19,6 +18,10 @@ class HttpClientFactory:
     Управляет жизненным циклом клиентов, лимитами concurrency и ротацией прокси.  # noqa: E501
     """
 
+    # Однократный флаг процесса: проверка httpx-API выполняется только
+    # при первой инициализации фабрики.
+    _httpx_validated: bool = False
+
     def __init__(self, settings: Any, proxy_manager: Any):
         self.settings = settings
         self.proxy_manager = proxy_manager
@@ -29,21 +32,64 @@ class HttpClientFactory:
         # Tasks).
         self._semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_CHUNKS)
 
+        # Свой генератор вместо общего random.* —
+        # без конкуренции за разделяемое состояние Mersenne Twister.
+        self._rng = random.Random()
+
         # Fail-Fast проверка совместимости httpx
         self._validate_library_capability()
 
-    def _validate_library_capability(self):
-        """Гарантирует, что httpx поддерживает нужный API (proxy=...)."""
-        sig = inspect.signature(httpx.AsyncClient)
-        if "proxy" not in sig.parameters:
+        # Конфигурация клиента неизменяема в рантайме —
+        # строим объекты один раз вместо каждого вызова client().
+        self._timeout = httpx.Timeout(
+            connect=settings.HTTP_TIMEOUT_CONNECT,
+            read=settings.HTTP_TIMEOUT_READ,
+            write=settings.HTTP_TIMEOUT_WRITE,
+            pool=settings.HTTP_TIMEOUT_POOL,
+        )
+        self._limits = httpx.Limits(
+            max_keepalive_connections=settings.MAX_CONCURRENT_CHUNKS,
+            max_connections=settings.MAX_CONCURRENT_CHUNKS * 2,
+        )
+
+        # Пул долгоживущих клиентов по прокси: TLS-handshake и HTTP/2-сессия
+        # переживают отдельные чанки вместо пересоздания на каждый вызов.
+        self._client_pool: dict[Optional[str], httpx.AsyncClient] = {}
+        self._pool_lock = asyncio.Lock()
+
+        # Кэш маскированных прокси-URL: набор прокси фиксирован,
+        # парсить/пересобирать URL на каждый error-log незачем.
+        self._mask_cache: dict[str, str] = {}
+
+    @classmethod
+    def _validate_library_capability(cls):
+        """Гарантирует, что httpx поддерживает нужный API (proxy=...).
+
+        Проверка выполняется один раз на процесс и читает co_varnames
+        напрямую — без дорогой рефлексии inspect.signature.
+        """
+        if cls._httpx_validated:
+            return
+        varnames = httpx.AsyncClient.__init__.__code__.co_varnames
+        if "proxy" not in varnames:
             raise RuntimeError(
                 "CRITICAL: Installed httpx version does not support 'proxy' argument. "  # noqa: E501
                 "Update dependencies to httpx>=0.27.0")
+        cls._httpx_validated = True
 
     def _mask_proxy_url(self, url: str) -> str:
-        """Безопасная маскировка пароля в URL."""
+        """Безопасная маскировка пароля в URL (результат кэшируется)."""
         if not url:
             return "Direct"
+        cached = self._mask_cache.get(url)
+        if cached is not None:
+            return cached
+        masked = self._compute_masked_url(url)
+        self._mask_cache[url] = masked
+        return masked
+
+    @staticmethod
+    def _compute_masked_url(url: str) -> str:
         try:
             parsed = urlparse(url)
             if parsed.password:
@@ -58,7 +104,7 @@ class HttpClientFactory:
 
     async def _jitter(self):
         """Вносит случайную задержку для размытия нагрузки."""
-        delay = random.uniform(
+        delay = self._rng.uniform(
             self.settings.JITTER_MIN, self.settings.JITTER_MAX
         )
         await asyncio.sleep(delay)
@@ -81,35 +127,47 @@ class HttpClientFactory:
 
             # Получение конфигурации через внедренные зависимости
             proxy_url: Optional[str] = self.proxy_manager.get_next_proxy()
-            headers = get_headers()
-
-            timeout = httpx.Timeout(
-                connect=self.settings.HTTP_TIMEOUT_CONNECT,
-                read=self.settings.HTTP_TIMEOUT_READ,
-                write=self.settings.HTTP_TIMEOUT_WRITE,
-                pool=self.settings.HTTP_TIMEOUT_POOL,
-            )
-
-            limits = httpx.Limits(
-                max_keepalive_connections=self.settings.MAX_CONCURRENT_CHUNKS,
-                max_connections=self.settings.MAX_CONCURRENT_CHUNKS * 2,
-            )
 
             try:
-                async with httpx.AsyncClient(
-                    proxy=proxy_url,
-                    headers=headers,
-                    timeout=timeout,
-                    limits=limits,
-                    follow_redirects=True,
-                    http2=True,
-                    verify=True,
-                ) as client:
-                    yield client
+                client = await self._get_pooled_client(proxy_url)
+                # Ротация User-Agent сохраняется на уровне заголовков клиента.
+                # Набор заменяем целиком, а не update(): merge оставил бы
+                # Sec-Ch-Ua* от предыдущего Chrome-профиля рядом с новым
+                # Firefox/Safari UA — противоречивый фингерпринт.
+                client.headers = httpx.Headers(get_headers())
+                yield client
             except Exception as e:
                 # Безопасное логирование
                 safe_proxy = self._mask_proxy_url(proxy_url or "")
                 logger.error(
-                    f"HTTP Client Init Failed. Proxy: {safe_proxy}. Error class: {  # noqa: E501
-                        e.__class__.__name__}")
+                    f"HTTP Client Init Failed. Proxy: {safe_proxy}. "
+                    f"Error class: {e.__class__.__name__}")
                 raise
+
+    async def _get_pooled_client(
+        self, proxy_url: Optional[str]
+    ) -> httpx.AsyncClient:
+        """Возвращает живой клиент для прокси, создавая его при первом обращении."""  # noqa: E501
+        async with self._pool_lock:
+            client = self._client_pool.get(proxy_url)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    proxy=proxy_url,
+                    headers=get_headers(),
+                    timeout=self._timeout,
+                    limits=self._limits,
+                    # Редиректы не следуем по умолчанию: страницы, которым это
+                    # нужно, передают follow_redirects=True на уровне запроса.
+                    http2=True,
+                    verify=True,
+                )
+                self._client_pool[proxy_url] = client
+            return client
+
+    async def close_all(self):
+        """Закрывает все клиенты пула (вызывать при shutdown сервиса)."""
+        async with self._pool_lock:
+            clients = list(self._client_pool.values())
+            self._client_pool.clear()
+        for client in clients:
+            await client.aclose()
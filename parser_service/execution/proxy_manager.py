@@ -1,15 +1,36 @@
 import random
-from typing import Optional, Set
+from typing import List, Optional, Tuple
 
 from parser_service.config.settings import settings
 
 
 class ProxyManager:
+    """
+    Ротация прокси на индексных структурах (SoA):
+    фиксированный tuple URL-ов, параллельный bytearray флагов "жив/в карантине"
+    и список активных индексов. Выбор и карантин — O(1), без пересборки
+    списков и хэширования строк на каждый вызов.
+    """
+
     def __init__(self):
         # Загружаем список один раз при инициализации
-        self.proxies = settings.get_proxy_list
-        # Множество для временного хранения "плохих" прокси
-        self._quarantined: Set[str] = set()
+        self.proxies: Tuple[str, ...] = tuple(settings.get_proxy_list)
+        # Обратный индекс URL -> позиция (строится один раз)
+        self._index_of = {url: i for i, url in enumerate(self.proxies)}
+        # Свой генератор вместо общего random.* — без конкуренции
+        # за разделяемое состояние Mersenne Twister.
+        self._rng = random.Random()
+        self._reset_rotation()
+
+    def _reset_rotation(self):
+        """Возвращает все прокси в ротацию."""
+        n = len(self.proxies)
+        # Параллельный массив флагов: 1 — в ротации, 0 — в карантине
+        self._alive = bytearray([1] * n)
+        # Активные индексы; удаление — swap-remove за O(1)
+        self._active: List[int] = list(range(n))
+        # Позиция каждого индекса внутри _active (для O(1) swap-remove)
+        self._active_pos: List[int] = list(range(n))
 
     def get_next_proxy(self) -> Optional[str]:
         """
@@ -19,21 +40,27 @@ class ProxyManager:
         if not self.proxies:
             return None  # Local/Direct mode
 
-        # Фильтруем прокси, которые в карантине
-        available = [p for p in self.proxies if p not in self._quarantined]
-
-        if not available:
+        if not self._active:
             # Если все прокси в карантине, сбрасываем его (Last Resort),
             # чтобы не останавливать работу полностью.
-            self._quarantined.clear()
-            available = self.proxies
+            self._reset_rotation()
 
-        return random.choice(available)
+        return self.proxies[self._rng.choice(self._active)]
 
     def quarantine_proxy(self, proxy_url: str):
         """Временно исключает прокси из ротации (до перезапуска процесса)"""
-        if proxy_url:
-            self._quarantined.add(proxy_url)
+        if not proxy_url:
+            return
+        i = self._index_of.get(proxy_url)
+        if i is None or not self._alive[i]:
+            return
+        self._alive[i] = 0
+        # swap-remove: переносим последний активный индекс на место удаляемого
+        pos = self._active_pos[i]
+        last = self._active[-1]
+        self._active[pos] = last
+        self._active_pos[last] = pos
+        self._active.pop()
 
 
 # Глобальный инстанс
@@ -1,11 +1,58 @@
 import logging
 from typing import Optional, Union
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from parser_service.parsing.models import PageType
 from parser_service.parsing.selectors import CSS
 
 logger = logging.getLogger(__name__)
 
+# Таблица для _clean_text: один C-проход str.translate
+# вместо четырёх цепочек .replace() (по аллокации на каждую).
+_WS_TRANS = str.maketrans({"\xa0": " ", "\r": " ", "\n": " ", "\t": " "})
+
+# Строим дерево только из тегов, которые реально читают сигнатуры
+# (selectors.CSS) и экстракторы: <script>/<style>/<svg>/<img> вне этих
+# контейнеров в DOM не попадают вовсе. textarea — ради
+# #g-recaptcha-response, meta — ради og:title и Description.
+_PARSE_STRAINER = SoupStrainer(
+    [
+        "meta",
+        "title",
+        "div",
+        "form",
+        "input",
+        "iframe",
+        "textarea",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "ul",
+        "li",
+        "p",
+        "a",
+        "span",
+        "i",
+        "strong",
+        "b",
+        "em",
+    ]
+)
+
+
+# Объединение всех сигнатур: один проход CSS-движка по дереву вместо
+# шести отдельных select'ов на каждую классификацию страницы.
+_CLASSIFY_SEL = ",".join(
+    (
+        CSS.SIGNATURE_WAF,
+        CSS.SIGNATURE_CAPTCHA,
+        CSS.SIGNATURE_404,
+        CSS.SIGNATURE_LOGIN,
+        CSS.SIGNATURE_RESUME,
+        CSS.SIGNATURE_SERP,
+    )
+)
+
 
 class BaseParser:
     """
@@ -15,10 +62,26 @@ class BaseParser:
 
     def __init__(self, html_content: Union[str, bytes], url: str):
         self.url = url
+        # Сырой ответ держим байтами: lxml декодирует их сам по заявленной
+        # кодировке (быстрый C-путь, без re-encode str→utf-8 внутри), а
+        # классификатор сканирует те же байты без текстовой выборки.
         if isinstance(html_content, bytes):
-            self.soup = BeautifulSoup(html_content, "lxml")
+            self._html_bytes = html_content
         else:
-            self.soup = BeautifulSoup(html_content, "lxml")
+            self._html_bytes = (html_content or "").encode("utf-8", "replace")
+
+        # Дешевая проверка до построения DOM: пустой/пробельный ответ
+        # классифицируем сразу, не тратя lxml-парс и сигнатурные селекторы.
+        if not self._html_bytes.strip():
+            self.soup = BeautifulSoup("", "lxml")
+            self._page_type = PageType.UNKNOWN
+            return
+
+        # Бэкенд "lxml" — осознанный выбор: токенизация и построение
+        # дерева идут в C-расширении, а не в html.parser на чистом Python.
+        self.soup = BeautifulSoup(
+            self._html_bytes, "lxml", parse_only=_PARSE_STRAINER
+        )
 
         self._page_type = self._classify_page()
 
@@ -31,40 +94,66 @@ class BaseParser:
         Классификация страницы.
         Приоритет: Блокировки -> Ошибки -> Логин -> Контент (Резюме/Список)
         """
-        text_lower = self.soup.get_text().lower()
+        # Маркеры ищем прямо в сырых байтах: один C-уровневый lower() +
+        # пара substring-сканов вместо get_text() (обход всех текстовых
+        # узлов + конкатенация ~100KB строки на каждую классификацию).
+        # Маркеры ASCII, поэтому bytes.lower() достаточно — без decode.
+        raw_lower = self._html_bytes.lower()
+
+        # Один select по объединённой сигнатуре; хиты раскладываем по
+        # категориям за линейный проход, приоритет сохраняет if-цепочка.
+        has_waf = has_captcha = has_login = False
+        has_resume = has_serp = False
+        h1_404 = None
+        for el in self.soup.select(_CLASSIFY_SEL):
+            name = el.name
+            el_id = el.get("id") or ""
+            classes = el.get("class") or ()
+            if name == "div" and "cf-error-details" in classes:
+                has_waf = True
+            elif el_id == "g-recaptcha-response" or name == "iframe":
+                has_captcha = True
+            elif name == "h1":
+                if h1_404 is None:
+                    h1_404 = el
+            elif name in ("form", "input"):
+                has_login = True
+            elif name == "div" and el_id.startswith("resume_"):
+                has_resume = True
+            elif el_id == "pjax-resume-list":
+                has_serp = True
 
         # 1. BAN (WAF / Access Denied)
-        if self.soup.select(CSS.SIGNATURE_WAF):
+        if has_waf:
             return PageType.BAN
         # Текстовая проверка для случаев, когда CSS не ловит
-        if "access denied" in text_lower or (
-            "cloudflare" in text_lower and "ray id" in text_lower
+        if b"access denied" in raw_lower or (
+            b"cloudflare" in raw_lower and b"ray id" in raw_lower
         ):
             return PageType.BAN
 
         # 2. CAPTCHA
-        if self.soup.select(CSS.SIGNATURE_CAPTCHA):
+        if has_captcha:
             return PageType.CAPTCHA
 
         # 3. NOT FOUND (404)
         # Комбинация селектора H1 и текста (обязательно!)
-        h1_404 = self.soup.select_one(CSS.SIGNATURE_404)
         if h1_404:
             h1_text = h1_404.get_text(strip=True).lower()
             if "не знайдено" in h1_text:
                 return PageType.NOT_FOUND
 
         # 4. LOGIN
-        if self.soup.select(CSS.SIGNATURE_LOGIN):
+        if has_login:
             return PageType.LOGIN
 
         # 5. RESUME (Строгая проверка)
         # Наличие специфичного контейнера с ID (div[id^='resume_'])
-        if self.soup.select_one(CSS.SIGNATURE_RESUME):
+        if has_resume:
             return PageType.RESUME
 
         # 6. SERP (Список)
-        if self.soup.select(CSS.SIGNATURE_SERP):
+        if has_serp:
             return PageType.SERP
 
         # Если есть H1, но нет контейнера резюме -> это НЕ резюме (например,
@@ -74,13 +163,7 @@ class BaseParser:
     def _clean_text(self, text: Optional[str]) -> Optional[str]:
         if not text:
             return None
-        text = (
-            text.replace("\xa0", " ")
-            .replace("\r", " ")
-            .replace("\n", " ")
-            .replace("\t", " ")
-        )
-        cleaned = " ".join(text.split())
+        cleaned = " ".join(text.translate(_WS_TRANS).split())
         return cleaned if cleaned else None
 
     def _get_text_safe(
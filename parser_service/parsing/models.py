@@ -4,7 +4,6 @@ from typing import List, Optional, Union
 from pydantic import (
     BaseModel,
     Field,
-    field_validator,
     model_validator,
     ConfigDict,
 )
@@ -39,14 +38,23 @@ class DataQuality(str, Enum):
 
 # --- 2. Component DTOs (Данные) ---
 
+# Общий конфиг для горячих DTO (создаются на каждую распарсенную страницу):
+# extra="ignore" и validate_default=False зафиксированы явно, чтобы никакая
+# будущая правка не включила лишние проходы валидации на этом пути.
+_HOT_DTO_CONFIG = ConfigDict(extra="ignore", validate_default=False)
+
 
 class SalaryDTO(BaseModel):
+    model_config = _HOT_DTO_CONFIG
+
     amount: Optional[int] = None
     currency: Optional[str] = None
     comment: Optional[str] = None
 
 
 class ExperienceEntryDTO(BaseModel):
+    model_config = _HOT_DTO_CONFIG
+
     company: Optional[str] = None
     position: Optional[str] = None
     period: Optional[str] = None
@@ -55,6 +63,8 @@ class ExperienceEntryDTO(BaseModel):
 
 
 class EducationEntryDTO(BaseModel):
+    model_config = _HOT_DTO_CONFIG
+
     institution: Optional[str] = None
     degree: Optional[str] = None
     year: Optional[str] = None
@@ -70,17 +80,17 @@ class BaseResumeData(BaseModel):
     resume_id: str
     url: str  # str вместо HttpUrl для сохранения каноничности
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(
+        str_strip_whitespace=True, extra="ignore", validate_default=False
+    )
 
-    @field_validator("url")
-    @classmethod
-    def validate_canonical_url(cls, v: str) -> str:
+    # Обидві перевірки (url + resume_id) в одному валідаторі:
+    # один диспатч Pydantic на DTO замість двох field-валідаторів.
+    @model_validator(mode="after")
+    def validate_identity(self) -> "BaseResumeData":
         # Канонізація: відкидаємо query (?puid=...) та fragment (#...)
-        v = v.strip()
+        v = self.url.strip()
         parts = urlsplit(v)
-        canonical = urlunsplit(
-            (parts.scheme, parts.netloc, parts.path, "", "")
-        )
 
         # Універсальна перевірка: URL має бути валідним і містити схему та домен  # noqa: E501
         # Це дозволить без проблем пропускати work.ua, robota.ua та
@@ -88,17 +98,18 @@ class BaseResumeData(BaseModel):
         if not parts.scheme or not parts.netloc:
             raise ValueError(f"Invalid URL format: {v}")
 
-        return canonical
+        self.url = urlunsplit(
+            (parts.scheme, parts.netloc, parts.path, "", "")
+        )
 
-    @field_validator("resume_id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        if not v:
+        if not self.resume_id:
             raise ValueError("resume_id cannot be empty")
         # Разрешаем цифры и буквы (на случай изменения формата ID)
-        if not v.isalnum():
-            raise ValueError(f"resume_id contains invalid characters: {v}")
-        return v
+        if not self.resume_id.isalnum():
+            raise ValueError(
+                f"resume_id contains invalid characters: {self.resume_id}"
+            )
+        return self
 
 
 class ResumeDetailData(BaseResumeData):
@@ -132,6 +143,13 @@ class ResumePreviewData(BaseResumeData):
     updated_at: Optional[str] = None
 
 
+# Типы страниц без полезной нагрузки: frozenset на уровне модуля —
+# O(1) membership без аллокации списка на каждую валидацию.
+_NON_DATA_PAGE_TYPES = frozenset(
+    {PageType.BAN, PageType.CAPTCHA, PageType.LOGIN, PageType.NOT_FOUND}
+)
+
+
 # --- 4. Result Container (Единый контракт парсера) ---
 
 
@@ -140,6 +158,8 @@ class ParsingResult(BaseModel):
     Единый контракт результата работы парсера.
     """
 
+    model_config = _HOT_DTO_CONFIG
+
     url: str
     page_type: PageType
     parsed_at: datetime = Field(
@@ -159,16 +179,12 @@ class ParsingResult(BaseModel):
     @model_validator(mode="after")
     def validate_integrity(self) -> "ParsingResult":
         # 1. Запрет на Payload при ошибках доступа
-        non_data_types = [
-            PageType.BAN,
-            PageType.CAPTCHA,
-            PageType.LOGIN,
-            PageType.NOT_FOUND,
-        ]
-        if self.page_type in non_data_types and self.payload is not None:
-            raise ValueError(
-                f"Payload must be None for page type {self.page_type}"
-            )
+        if self.page_type in _NON_DATA_PAGE_TYPES:
+            if self.payload is not None:
+                raise ValueError(
+                    f"Payload must be None for page type {self.page_type}"
+                )
+            return self
 
         # 2. Валидация типов Payload в зависимости от PageType
         if self.quality != DataQuality.ERROR:
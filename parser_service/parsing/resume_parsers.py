@@ -18,6 +18,49 @@ from parser_service.parsing.selectors import CSS
 
 logger = logging.getLogger(__name__)
 
+# Скомпильованные один раз паттерны горячего пути парсинга.
+# pattern.method(str) обходит и повторную компиляцию, и SRE-кэш lookup.
+_OG_TITLE_RE = re.compile(r"«(.*?)»")
+_RESUME_ID_RE = re.compile(r"/resumes/([a-zA-Z0-9]+)")
+_SALARY_IN_TITLE_RE = re.compile(
+    r"(\d[\d\s]+)\s*(грн|UAH|\$|USD|€|EUR)", re.IGNORECASE
+)
+_AMOUNT_RE = re.compile(r"(\d+)")
+# Обидва варіанти маркера періоду — одна альтернація, один прохід;
+# внутрішня група незахоплююча, щоб SRE не вів зайвий bookkeeping.
+_PERIOD_RE = re.compile(
+    r"(\w+\s+\d{4}\s*[\—\-].*|\d+\s+(?:роки|років|months|years).*)"
+)
+_EDU_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+# Класифікація h2 двома скомпільованими альтернаціями замість п'яти
+# substring-сканів. Стартери перевіряються ПЕРШИМИ незалежно від позиції
+# слова в тексті: "додаткова освіта та сертифікати" — це стартер освіти,
+# хоча "додаткова" (термінатор) стоїть у заголовку раніше.
+_H2_STARTER_RE = re.compile(
+    r"(?P<exp>досвід)|(?P<edu>освіта)|(?P<skills>навички|знання)"
+)
+_H2_TERMINATOR_RE = re.compile(
+    r"контактна|інші|схожі|додаткова|кандидати"
+)
+# Теги та &nbsp; зносимо однією альтернацією — один прохід замість
+# окремого sub і окремого replace.
+_HTML_TAG_OR_NBSP_RE = re.compile(r"<[^>]+>|&nbsp;")
+_WS_RE = re.compile(r"\s+")
+# Видалення пробілів/nbsp із рядка зарплати: один C-прохід translate
+# замість двох .replace() (кожен — окрема аллокація).
+_SALARY_STRIP_TRANS = str.maketrans("", "", " \xa0")
+# Валюта визначається одним скануванням + lookup у мапі, а не серією
+# окремих substring-перевірок по рядку зарплати.
+_CURRENCY_RE = re.compile(r"USD|\$|EUR|€|UAH|грн", re.IGNORECASE)
+_CURRENCY_MAP = {
+    "$": "USD",
+    "USD": "USD",
+    "€": "EUR",
+    "EUR": "EUR",
+    "UAH": "UAH",
+    "ГРН": "UAH",
+}
+
 
 # =====================================================================
 # 1. PARSER ДЛЯ WORK.UA (HTML Parsing)
@@ -39,6 +82,11 @@ class WorkUaResumeParser(BaseParser):
 
         canonical_url = None
         try:
+            # Контейнер резюме шукаємо один раз: він потрібен і як сигнатура,
+            # і як fallback для resume_id, і як межа сканування секцій.
+            resume_container = self.soup.select_one(CSS.SIGNATURE_RESUME)
+            self._resume_container = resume_container
+
             resume_id = self._extract_resume_id()
             canonical_url = f"https://www.work.ua/resumes/{resume_id}/"
 
@@ -65,7 +113,6 @@ class WorkUaResumeParser(BaseParser):
                 languages=[],
             )
 
-            resume_container = self.soup.select_one(CSS.SIGNATURE_RESUME)
             if not resume_container:
                 raise ValueError(
                     "Resume signature container (div[id^='resume_']) not found in DOM"  # noqa: E501
@@ -99,15 +146,25 @@ class WorkUaResumeParser(BaseParser):
                 error_message=msg,
             )
 
+    def _position_element(self) -> Optional[Tag]:
+        """Блок посади (CSS.RESUME_POSITION), найдений один раз на резюме.
+
+        Його читають і _extract_salary, і _extract_title — кешуємо Tag,
+        щоб не ганяти CSS-двигун по DOM двічі.
+        """
+        if not hasattr(self, "_position_el"):
+            self._position_el = self.soup.select_one(CSS.RESUME_POSITION)
+        return self._position_el
+
     def _extract_title(self) -> Optional[str]:
         meta_tag = self.soup.select_one('meta[property="og:title"]')
         if meta_tag and meta_tag.has_attr("content"):
             content = meta_tag["content"]
-            match = re.search(r"«(.*?)»", content)
+            match = _OG_TITLE_RE.search(content)
             if match:
                 return match.group(1).strip()
 
-        h2_el = self.soup.select_one(CSS.RESUME_POSITION)
+        h2_el = self._position_element()
         if h2_el:
             for span in h2_el.select("span"):
                 span.decompose()
@@ -116,11 +173,13 @@ class WorkUaResumeParser(BaseParser):
         return None
 
     def _extract_resume_id(self) -> str:
-        match = re.search(r"/resumes/([a-zA-Z0-9]+)", self.url)
+        match = _RESUME_ID_RE.search(self.url)
         if match:
             return match.group(1)
 
-        container = self.soup.select_one(CSS.SIGNATURE_RESUME)
+        container = getattr(self, "_resume_container", None)
+        if container is None:
+            container = self.soup.select_one(CSS.SIGNATURE_RESUME)
         if container and container.has_attr("id"):
             val = container["id"].replace("resume_", "")
             if val:
@@ -130,28 +189,26 @@ class WorkUaResumeParser(BaseParser):
     def _extract_salary(self) -> Optional[SalaryDTO]:
         raw_text = self._get_text_safe(self.soup, CSS.RESUME_SALARY_BLOCK)
         if not raw_text:
-            h2_text = self._get_text_safe(self.soup, CSS.RESUME_POSITION)
+            h2_el = self._position_element()
+            h2_text = self._clean_text(h2_el.get_text()) if h2_el else None
             if h2_text:
-                match = re.search(
-                    r"(\d[\d\s]+)\s*(грн|UAH|\$|USD|€|EUR)",
-                    h2_text,
-                    re.IGNORECASE,
-                )
+                match = _SALARY_IN_TITLE_RE.search(h2_text)
                 if match:
                     raw_text = match.group(0)
 
         if not raw_text:
             return None
 
-        clean_str = raw_text.replace(" ", "").replace("\xa0", "")
-        amount_match = re.search(r"(\d+)", clean_str)
+        clean_str = raw_text.translate(_SALARY_STRIP_TRANS)
+        amount_match = _AMOUNT_RE.search(clean_str)
         if amount_match:
             amount = int(amount_match.group(1))
-            currency = "UAH"
-            if "$" in raw_text or "USD" in raw_text.upper():
-                currency = "USD"
-            elif "€" in raw_text or "EUR" in raw_text.upper():
-                currency = "EUR"
+            cur_match = _CURRENCY_RE.search(raw_text)
+            currency = (
+                _CURRENCY_MAP[cur_match.group(0).upper()]
+                if cur_match
+                else "UAH"
+            )
             return SalaryDTO(amount=amount, currency=currency)
         return None
 
@@ -161,78 +218,74 @@ class WorkUaResumeParser(BaseParser):
         headers = container.find_all("h2")
         current_section = None
 
-        SECTION_STARTERS = {
-            "досвід": "exp",
-            "освіта": "edu",
-            "навички": "skills",
-            "знання": "skills",
-        }
-        SECTION_TERMINATORS = [
-            "контактна",
-            "інші",
-            "схожі",
-            "додаткова",
-            "кандидати",
-        ]
+        # Локальні біндінги: без LOAD_ATTR-lookup'а на кожен h2 циклу.
+        clean = self._clean_text
+        parse_exp = self._parse_experience_block
+        parse_edu = self._parse_education_block
 
         for h2 in headers:
-            text = self._clean_text(h2.get_text()).lower()
+            text = clean(h2.get_text()).lower()
             if not text:
                 continue
 
-            is_starter = False
-            for key, val in SECTION_STARTERS.items():
-                if key in text:
-                    current_section = val
-                    is_starter = True
-                    break
-            if is_starter:
+            m = _H2_STARTER_RE.search(text)
+            if m:
+                current_section = m.lastgroup
                 continue
 
-            if any(term in text for term in SECTION_TERMINATORS):
+            if _H2_TERMINATOR_RE.search(text):
                 current_section = None
                 continue
 
             if current_section == "exp":
-                self._parse_experience_block(h2, data)
+                parse_exp(h2, data)
             elif current_section == "edu":
-                self._parse_education_block(h2, data)
+                parse_edu(h2, data)
 
         self._parse_skills_tags(container, data)
 
     def _get_block_content(self, h2_element: Tag) -> str:
+        # Один прохід по сусідніх вузлах: сирий текст збираємо як є,
+        # а нормалізацію пробілів робимо одним викликом на весь блок,
+        # а не окремо для кожного вузла. Вузли розрізняємо за атрибутом
+        # name (у текстових вузлів його немає) — без isinstance на кожен.
         content_parts = []
         for sibling in h2_element.next_siblings:
-            if isinstance(sibling, Tag):
-                if sibling.name == "h2":
+            name = getattr(sibling, "name", None)
+            if name is not None:
+                if name == "h2":
                     break
-                text = self._clean_text(sibling.get_text())
-                if text:
-                    content_parts.append(text)
-            elif sibling.string:
-                text = str(sibling).strip()
-                if text:
-                    content_parts.append(text)
-        return " ".join(content_parts)
+                content_parts.append(sibling.get_text())
+            else:
+                content_parts.append(str(sibling))
+        return self._clean_text(" ".join(content_parts)) or ""
+
+    def _split_block_text(
+        self, h2_element: Tag, marker_re: re.Pattern
+    ) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Загальний скелет розбору блоку: текст блоку, знайдений маркер
+        (період/рік) та частина тексту перед маркером.
+        """
+        full_text = self._get_block_content(h2_element)
+        if not full_text:
+            return None, None, None
+        match = marker_re.search(full_text)
+        if not match:
+            return full_text, None, None
+        # Межу беремо з позиції матчу: O(1) зріз замість split, який
+        # повторно сканує рядок і будує список.
+        return full_text, match.group(0), full_text[: match.start()]
 
     def _parse_experience_block(self, h2_element: Tag, data: ResumeDetailData):
         position = self._clean_text(h2_element.get_text())
-        full_text = self._get_block_content(h2_element)
+        full_text, period, lead = self._split_block_text(
+            h2_element, _PERIOD_RE
+        )
         if not full_text:
             return
 
-        company = full_text
-        period = None
-        period_match = re.search(
-            r"(\w+\s+\d{4}\s*[\—\-].*|\d+\s+(роки|років|months|years).*)",
-            full_text,
-        )
-        if period_match:
-            period = period_match.group(0)
-            company_part = full_text.split(period)[0]
-            if company_part:
-                company = company_part.strip(" .,-")
-
+        company = lead.strip(" .,-") if lead else full_text
         data.experience.append(
             ExperienceEntryDTO(
                 position=position, company=company, period=period
@@ -241,19 +294,13 @@ class WorkUaResumeParser(BaseParser):
 
     def _parse_education_block(self, h2_element: Tag, data: ResumeDetailData):
         institution = self._clean_text(h2_element.get_text())
-        full_text = self._get_block_content(h2_element)
+        full_text, year, lead = self._split_block_text(
+            h2_element, _EDU_YEAR_RE
+        )
 
-        year, specialty = None, None
+        specialty = None
         if full_text:
-            match = re.search(r"\b(19|20)\d{2}\b", full_text)
-            if match:
-                year = match.group(0)
-            if year:
-                specialty_cand = full_text.split(year)[0].strip(" .,-")
-                if specialty_cand:
-                    specialty = specialty_cand
-            else:
-                specialty = full_text
+            specialty = (lead.strip(" .,-") or None) if year else full_text
 
         data.education.append(
             EducationEntryDTO(
@@ -264,13 +311,20 @@ class WorkUaResumeParser(BaseParser):
     def _parse_skills_tags(
         self, container: Tag | BeautifulSoup, data: ResumeDetailData
     ):
-        tags = container.select(CSS.SKILL_TAGS)
-        unique_skills = set()
-        for tag in tags:
-            txt = self._clean_text(tag.get_text())
-            if txt:
-                unique_skills.add(txt)
-        data.skills = list(unique_skills)
+        # dict.fromkeys дедуплікує за один прохід і зберігає порядок
+        # тегів у DOM — детермінований вивід для кешів нижче по пайплайну.
+        # _clean_text біндимо локально, щоб не платити LOAD_ATTR на тег.
+        clean = self._clean_text
+        data.skills = list(
+            dict.fromkeys(
+                txt
+                for txt in (
+                    clean(tag.get_text())
+                    for tag in container.select(CSS.SKILL_TAGS)
+                )
+                if txt
+            )
+        )
 
 
 # =====================================================================
@@ -289,9 +343,8 @@ class RobotaUaResumeParser:
         """Очищає HTML-теги з тексту навичок та досвіду"""
         if not raw_html:
             return ""
-        clean_text = re.sub(r"<[^>]+>", " ", raw_html)
-        clean_text = clean_text.replace("&nbsp;", " ")
-        return re.sub(r"\s+", " ", clean_text).strip()
+        clean_text = _HTML_TAG_OR_NBSP_RE.sub(" ", raw_html)
+        return _WS_RE.sub(" ", clean_text).strip()
 
     def parse(self) -> ParsingResult:
         try:
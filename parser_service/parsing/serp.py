@@ -3,6 +3,8 @@ import re
 from typing import List, Optional
 from urllib.parse import urljoin
 
+import soupsieve
+
 from parser_service.parsing.base import BaseParser
 from parser_service.parsing.models import (
     ParsingResult,
@@ -14,6 +16,28 @@ from parser_service.parsing.selectors import CSS
 
 logger = logging.getLogger(__name__)
 
+# Паттерны SERP компилируются один раз: _parse_item вызывается на каждую
+# карточку выдачи, total_found — на каждую страницу.
+_SERP_RESUME_ID_RE = re.compile(r"/resumes/(\d+)")
+_META_TOTAL_RE = re.compile(r"^(\d+)\s+кандидат")
+_TEXT_TOTAL_RE = re.compile(r"(\d+)\s+кандидат")
+_NUMS_RE = re.compile(r"\b\d[\d\s\u00A0]{0,10}\b")
+# Селектори, що виконуються на кожну картку видачі, компілюються
+# soupsieve один раз: без повторного lookup'а в його внутрішньому кеші
+# (хешування рядка селектора) на кожен виклик select_one.
+_SEL_SERP_ITEM = soupsieve.compile(CSS.SERP_ITEM)
+_SEL_SERP_LINK = soupsieve.compile(CSS.SERP_LINK)
+_SEL_SERP_SNIPPET = soupsieve.compile(CSS.SERP_SNIPPET)
+_SEL_UPDATED_AT = soupsieve.compile("div.text-muted span.text-default")
+# Вік та місто зі сніпета ("25 років, Київ") одним проходом
+# регекспа: без проміжних списків від re.split/str.split на кожну
+# картку.
+_AGE_CITY_RE = re.compile(
+    r"(?P<age>\d{1,2})\s*(?:рок(?:и|ів)?|рік|лет|года?)"
+    r"(?:\s*,\s*(?P<city>[^,•|·]+))?",
+    re.IGNORECASE,
+)
+
 
 class SerpParser(BaseParser):
     """
@@ -35,7 +59,7 @@ class SerpParser(BaseParser):
         # 2. Итерация по карточкам
         # Используем селектор карточки из CSS (он учитывает .card и
         # .card-visited)
-        cards = self.soup.select(CSS.SERP_ITEM)
+        cards = _SEL_SERP_ITEM.select(self.soup)
 
         if not cards:
             # Страница SERP, но карточек нет? Возможно, пустая выдача или смена
@@ -49,11 +73,14 @@ class SerpParser(BaseParser):
                 # Считаем частичным успехом (пустой список)
             )
 
+        # Локальные биндинги на горячий цикл по карточкам
+        parse_item = self._parse_item
+        append_item = items.append
         for card in cards:
             try:
-                item = self._parse_item(card)
+                item = parse_item(card)
                 if item:
-                    items.append(item)
+                    append_item(item)
             except Exception as e:
                 # Ошибка в одной карточке не должна ломать весь парсинг
                 logger.warning(f"Failed to parse SERP item: {e}")
@@ -95,7 +122,7 @@ class SerpParser(BaseParser):
             if meta_desc and meta_desc.get("content"):
                 content = meta_desc["content"]
                 # Шукаємо ЧИСЛО перед словом "кандидат"
-                match = re.search(r"^(\d+)\s+кандидат", content)
+                match = _META_TOTAL_RE.search(content)
                 if match:
                     total_found = int(match.group(1))
         except Exception:
@@ -106,7 +133,7 @@ class SerpParser(BaseParser):
             try:
                 text = self.soup.get_text(" ", strip=True)
                 # Шукаємо число перед "кандидат" в тексті сторінки
-                match = re.search(r"(\d+)\s+кандидат", text)
+                match = _TEXT_TOTAL_RE.search(text)
                 if match:
                     total_found = int(match.group(1))
             except Exception:
@@ -116,7 +143,7 @@ class SerpParser(BaseParser):
         if total_found is None:
             try:
                 text = self.soup.get_text(" ", strip=True)
-                nums = re.findall(r"\b\d[\d\s\u00A0]{0,10}\b", text)
+                nums = _NUMS_RE.findall(text)
                 candidates = []
                 for s in nums:
                     n = int(s.replace(" ", "").replace("\u00a0", ""))
@@ -141,7 +168,7 @@ class SerpParser(BaseParser):
 
         # 1. Ссылка и Заголовок (Mandatory)
         # Ищем ссылку внутри карточки
-        link_el = card_element.select_one(CSS.SERP_LINK)
+        link_el = _SEL_SERP_LINK.select_one(card_element)
         if not link_el or not link_el.has_attr("href"):
             # Карточка без ссылки бесполезна
             return None
@@ -152,28 +179,42 @@ class SerpParser(BaseParser):
 
         # Извлекаем ID из URL
         # Паттерн: /resumes/1234567/ -> берем цифры
-        resume_id_match = re.search(r"/resumes/(\d+)", full_url)
+        resume_id_match = _SERP_RESUME_ID_RE.search(full_url)
         if not resume_id_match:
             # Если ID не найден в URL, пропускаем (это может быть реклама)
             return None
         resume_id = resume_id_match.group(1)
 
-        title = self._clean_text(link_el.get_text())
+        clean = self._clean_text
+        title = clean(link_el.get_text())
 
         # 2. Мета-данные (Optional)
-        # Возраст/Город часто лежат в snippet (CSS.SERP_SNIPPET) или mt-sm.
-        # TODO: добавить RegEx для вытаскивания возраста из snippet_text → утилиты нормализации.  # noqa: E501
-        # Для простоты пока заполняем только то, что явно видим (updated_at).
-
-        updated_at = self._get_text_safe(
-            card_element, "div.text-muted span.text-default"
-        )  # Примерный селектор даты
+        # Возраст/Город лежат в snippet (CSS.SERP_SNIPPET): строка вида
+        # "25 років, Київ". Одна регексп-группа вместо цепочки split'ов.
+        age = None
+        city = None
+        snippet_el = _SEL_SERP_SNIPPET.select_one(card_element)
+        snippet_text = (
+            clean(snippet_el.get_text()) if snippet_el else None
+        )
+        if snippet_text:
+            m = _AGE_CITY_RE.search(snippet_text)
+            if m:
+                age = m.group("age")
+                raw_city = m.group("city")
+                city = raw_city.strip() if raw_city else None
+
+        updated_el = _SEL_UPDATED_AT.select_one(card_element)
+        # Примерный селектор даты
+        updated_at = (
+            clean(updated_el.get_text()) if updated_el else None
+        )
 
         return ResumePreviewData(
             resume_id=resume_id,
             url=full_url,
             title=title,
-            # age и city пока оставляем None, так как они требуют парсинга строки "25 лет, Киев"  # noqa: E501
-            # Мы добавим это в утилиты нормализации позже.
+            age=age,
+            city=city,
             updated_at=updated_at,
         )
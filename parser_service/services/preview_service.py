@@ -208,13 +208,17 @@ def _robotaua_item_from_url(url: str) -> ParserPreviewItem:
     )
 
 
+_WORKUA_RESUME_ID_RE = re.compile(r"/resumes/([^/?#]+)/?")
+_ROBOTAUA_RESUME_ID_RE = re.compile(r"/candidates/([^/?#]+)/?")
+
+
 def _extract_workua_resume_id(url: str) -> str | None:
-    match = re.search(r"/resumes/([^/?#]+)/?", url)
+    match = _WORKUA_RESUME_ID_RE.search(url)
     return match.group(1) if match else None
 
 
 def _extract_robotaua_resume_id(url: str) -> str | None:
-    match = re.search(r"/candidates/([^/?#]+)/?", url)
+    match = _ROBOTAUA_RESUME_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -2,12 +2,15 @@ import random
 import logging
 import re
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
 import httpx
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from parser_service.execution.executor import RequestExecutor
-from parser_service.parsing.base import BaseParser
 from parser_service.parsing.serp import SerpParser
 from parser_service.parsing.resume_parsers import WorkUaResumeParser
 from parser_service.parsing.models import PageType, DataQuality, ParsingResult
@@ -15,6 +18,20 @@ from parser_service.storage.repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Обмежений LRU-кеш розпарсених сторінок за хешем HTML: при повторному
+# скрапінгу того самого резюме (backfill, перезапуск чанка) пропускаємо
+# побудову DOM повністю. Ключ — digest, а не сам HTML, щоб не тримати
+# мегабайти розмітки в пам'яті воркера.
+_PARSE_CACHE: "OrderedDict[bytes, ParsingResult]" = OrderedDict()
+_PARSE_CACHE_MAX = 256
+
+# Схлопування повторних дефісів у слагах — скомпільовано один раз.
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+def _parse_cache_key(html_content: bytes) -> bytes:
+    return hashlib.blake2b(html_content, digest_size=16).digest()
+
 
 class WorkUaAdapter:
     """
@@ -26,6 +43,12 @@ class WorkUaAdapter:
     JITTER_MIN = 1.5
     JITTER_MAX = 2.5
 
+    # Скільки детальних сторінок тримаємо "в польоті" одночасно.
+    # Jitter між стартами запитів залишається глобальним (див.
+    # run_from_urls), тож сумарний RPS не зростає — паралелізм лише
+    # ховає RTT та час парсингу за паузою наступного запиту.
+    CONCURRENCY_DETAIL = 3
+
     BASE_URL = "https://www.work.ua"
     CITY_SLUGS = {
         "киев": "kyiv",
@@ -56,8 +79,25 @@ class WorkUaAdapter:
         self.name = "workua"
         self.executor = executor
         self.repository = repository
+        # Момент старту останнього запиту: пауза рахується від нього,
+        # а не додається безумовно (див. _pace).
+        self._last_request_ts = 0.0
+
+    async def _pace(self) -> None:
+        """
+        Адаптивна анти-бот пауза: чекаємо лише залишок jitter-інтервалу
+        від попереднього запиту. Якщо парсинг/мережа вже "з'їли" паузу,
+        не спимо зайвого — інтервал між запитами до сервера той самий.
+        """
+        now = time.monotonic()
+        due = self._last_request_ts + random.uniform(
+            self.JITTER_MIN, self.JITTER_MAX
+        )
+        if due > now:
+            await asyncio.sleep(due - now)
+        self._last_request_ts = time.monotonic()
 
-    async def _fetch_html(self, url: str) -> str:
+    async def _fetch_html(self, url: str) -> bytes:
         """Асинхронна обгортка для безпечного виклику RequestExecutor з Resilience-політиками"""  # noqa: E501
 
         async def _do_fetch():
@@ -68,13 +108,16 @@ class WorkUaAdapter:
                         url, timeout=15.0, follow_redirects=True
                     )
                 )
-                return response.text
+                # Сирі байти без .text: BaseParser і кеш-ключ працюють з
+                # bytes напряму, тож декодування charset у str (і зворотний
+                # encode у парсері) на ~100KB сторінку більше не потрібні.
+                return response.content
 
         try:
             return await _do_fetch()
         except Exception as e:
             logger.error(f"[{self.name}] Мережева або Resilience помилка: {e}")
-            return ""
+            return b""
 
     async def preview(self, search_payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -92,89 +135,116 @@ class WorkUaAdapter:
         urls: List[str] = []
         seen: set[str] = set()
         real_total = None
+        max_pages = int(max_pages)
+
+        # --- ДОДАНО ОБРОБКУ МОВ ---
+        languages = search_payload.get("languages", [])
+        mapped_langs = (
+            self._map_language_levels(languages) if languages else None
+        )
+        # --------------------------
 
-        for page_num in range(1, int(max_pages) + 1):
+        def _page_url(page_num: int) -> str:
             current_params = dict(params)
             if page_num > 1:
                 current_params["page"] = page_num
-
-            # --- ДОДАНО ОБРОБКУ МОВ ---
-            languages = search_payload.get("languages", [])
-            if languages:
-                mapped_langs = self._map_language_levels(languages)
-                if mapped_langs:
-                    current_params["language_level"] = mapped_langs
-            # --------------------------
-
+            if mapped_langs:
+                current_params["language_level"] = mapped_langs
             try:
                 if direct_url:
-                    current_url = self._append_page_to_url(
-                        direct_url, page_num
-                    )
-                else:
-                    current_url = self._build_url(query, city, current_params)
+                    return self._append_page_to_url(direct_url, page_num)
+                return self._build_url(query, city, current_params)
             except Exception as e:
                 raise RuntimeError(f"Помилка генерації URL: {e}")
 
-            logger.info(
-                f"[{self.name}] 📎 Preview SERP page {page_num}: {current_url}"
-            )
+        async def _delayed_fetch(url: str) -> bytes:
+            # Jitter перед запитом лишається тим самим; він іде у фоні,
+            # поки парситься поточна сторінка.
+            await self._pace()
+            return await self._fetch_html(url)
+
+        # Пайплайн: поки поточна сторінка парситься, наступна вже чекає
+        # свій jitter і вантажиться у фоні — RTT ховається за парсингом.
+        # Якщо цикл обривається, prefetch скасовується ще на етапі паузи
+        # (парсинг на порядки коротший за jitter), тож зайвий запит на
+        # сервер не йде.
+        next_task: "Optional[asyncio.Task[bytes]]" = None
+        try:
+            for page_num in range(1, max_pages + 1):
+                current_url = _page_url(page_num)
 
-            try:
-                html_content = await self._fetch_html(current_url)
-                if not html_content:
-                    raise RuntimeError(
-                        f"Порожня відповідь від сервера на сторінці {page_num}"
-                    )
-            except Exception as e:
-                raise RuntimeError(f"Мережева помилка: {e}")
+                logger.info(
+                    f"[{self.name}] 📎 Preview SERP page {page_num}: {current_url}"  # noqa: E501
+                )
 
-            base_parser = BaseParser(html_content, current_url)
-            self._check_page_safety(
-                base_parser.page_type, context="SERP_PREVIEW"
-            )
+                try:
+                    if next_task is not None:
+                        html_content = await next_task
+                        next_task = None
+                    else:
+                        html_content = await self._fetch_html(current_url)
+                    if not html_content:
+                        raise RuntimeError(
+                            f"Порожня відповідь від сервера на сторінці {page_num}"  # noqa: E501
+                        )
+                except Exception as e:
+                    raise RuntimeError(f"Мережева помилка: {e}")
+
+                if page_num < max_pages:
+                    next_task = asyncio.create_task(
+                        _delayed_fetch(_page_url(page_num + 1))
+                    )
 
-            if base_parser.page_type != PageType.SERP:
-                logger.warning(
-                    f"[{self.name}] Неочікуваний тип сторінки. Зупинка."
+                # SerpParser успадковує класифікацію від BaseParser: один
+                # lxml-парс і на page_type, і на parse(), без другого
+                # побудування дерева з того самого HTML.
+                serp_parser = SerpParser(html_content, current_url)
+                self._check_page_safety(
+                    serp_parser.page_type, context="SERP_PREVIEW"
                 )
-                break
 
-            serp_parser = SerpParser(html_content, current_url)
-            serp_result = serp_parser.parse()
+                if serp_parser.page_type != PageType.SERP:
+                    logger.warning(
+                        f"[{self.name}] Неочікуваний тип сторінки. Зупинка."
+                    )
+                    break
 
-            if serp_result.quality == DataQuality.ERROR:
-                logger.error(
-                    f"[{self.name}] Помилка парсингу SERP: {serp_result.error_message}"  # noqa: E501
-                )
-                break
+                serp_result = serp_parser.parse()
 
-            if page_num == 1:
+                if serp_result.quality == DataQuality.ERROR:
+                    logger.error(
+                        f"[{self.name}] Помилка парсингу SERP: {serp_result.error_message}"  # noqa: E501
+                    )
+                    break
+
+                if page_num == 1:
+                    try:
+                        real_total = getattr(serp_result, "total_found", None)
+                    except Exception:
+                        pass
+
+                previews = serp_result.payload or []
+                if not previews:
+                    break
+
+                new_urls_found = False
+                for p in previews:
+                    u = getattr(p, "url", None)
+                    if isinstance(u, str) and u and u not in seen:
+                        seen.add(u)
+                        urls.append(u)
+                        new_urls_found = True
+
+                if not new_urls_found:
+                    break
+        finally:
+            if next_task is not None:
+                next_task.cancel()
                 try:
-                    real_total = getattr(serp_result, "total_found", None)
-                except Exception:
+                    await next_task
+                except (asyncio.CancelledError, Exception):
                     pass
 
-            previews = serp_result.payload or []
-            if not previews:
-                break
-
-            new_urls_found = False
-            for p in previews:
-                u = getattr(p, "url", None)
-                if isinstance(u, str) and u and u not in seen:
-                    seen.add(u)
-                    urls.append(u)
-                    new_urls_found = True
-
-            if not new_urls_found:
-                break
-
-            if page_num < int(max_pages):
-                await asyncio.sleep(
-                    random.uniform(self.JITTER_MIN, self.JITTER_MAX)
-                )
-
         total_to_return = (
             int(real_total)
             if isinstance(real_total, int) and real_total > 0
@@ -193,67 +263,113 @@ class WorkUaAdapter:
         if not urls:
             return stats, results
 
-        for url in urls:
-            await asyncio.sleep(
-                random.uniform(self.JITTER_MIN, self.JITTER_MAX)
-            )
+        # Обмежений паралелізм: до CONCURRENCY_DETAIL сторінок у польоті.
+        # pace_lock серіалізує jitter-паузи перед стартом запиту, тому
+        # інтервали між запитами до сервера ті самі, що й у послідовного
+        # циклу — виграш лише в тому, що RTT і парсинг попередніх сторінок
+        # перекриваються з паузою наступної.
+        sem = asyncio.Semaphore(self.CONCURRENCY_DETAIL)
+        pace_lock = asyncio.Lock()
+        stopped = False  # критична помилка: нові запити не стартуємо
 
-            try:
-                html_content = await self._fetch_html(url)
-                if not html_content:
-                    logger.warning(f"[{self.name}] Порожній контент: {url}")
-                    stats["errors"] += 1
-                    continue
-            except Exception as e:
-                logger.error(f"[{self.name}] Помилка завантаження {url}: {e}")
-                stats["errors"] += 1
-                continue
+        # Локальні біндинги на весь батч: замикання читає їх з комірок
+        # closure замість LOAD_ATTR по self на кожний URL.
+        name = self.name
+        fetch_html = self._fetch_html
+        check_page_safety = self._check_page_safety
+        pace = self._pace
 
-            base_parser = BaseParser(html_content, url)
+        async def _process(url: str) -> Optional[ParsingResult]:
+            nonlocal stopped
+
+            async with sem:
+                if stopped:
+                    return None
+
+                async with pace_lock:
+                    await pace()
+
+                try:
+                    html_content = await fetch_html(url)
+                    if not html_content:
+                        logger.warning(
+                            f"[{name}] Порожній контент: {url}"
+                        )
+                        stats["errors"] += 1
+                        return None
+                except Exception as e:
+                    logger.error(
+                        f"[{name}] Помилка завантаження {url}: {e}"
+                    )
+                    stats["errors"] += 1
+                    return None
+
+            # Кеш перевіряємо ДО побудови парсера: на хіті не платимо ні
+            # за lxml-дерево, ні за класифікацію — лише blake2b по байтах.
+            # ParsingResult несе свій page_type, тож перевірка безпеки
+            # працює і для кешованого результату.
+            cache_key = _parse_cache_key(html_content)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(cache_key)
+                # Глибока копія: payload мутабельний, кешований оригінал
+                # не повинен ділити стан із результатом, що піде далі.
+                result = cached.model_copy(deep=True, update={"url": url})
+                page_type = result.page_type
+            else:
+                # Один парсер на сторінку: класифікація (page_type) і
+                # витягування даних ділять одне lxml-дерево замість
+                # окремого BaseParser + повторного парсу тим самим HTML.
+                resume_parser = WorkUaResumeParser(html_content, url)
+                page_type = resume_parser.page_type
 
-            if base_parser.page_type == PageType.NOT_FOUND:
+            if page_type == PageType.NOT_FOUND:
                 logger.warning(
-                    f"[{self.name}] Резюме не знайдено (404): {url}"
+                    f"[{name}] Резюме не знайдено (404): {url}"
                 )
                 stats["errors"] += 1
-                continue
+                return None
 
             # 2. Гібридний Fail Fast: ловимо RuntimeError з _check_page_safety
             try:
-                self._check_page_safety(
-                    base_parser.page_type, context="DETAIL"
-                )
+                check_page_safety(page_type, context="DETAIL")
             except RuntimeError as e:
-                logger.critical(f"[{self.name}] Збір перервано: {e}")
+                # Зупиняємо подальший збір, але повертаємо те, що вже зібрали
+                logger.critical(f"[{name}] Збір перервано: {e}")
                 stats["critical_error"] = str(e)
-                break  # Зупиняємо збір, але повертаємо те, що вже зібрали
+                stopped = True
+                return None
 
-            resume_parser = WorkUaResumeParser(html_content, url)
-            result = resume_parser.parse()
+            if cached is None:
+                result = resume_parser.parse()
+                if result.quality != DataQuality.ERROR:
+                    _PARSE_CACHE[cache_key] = result
+                    if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                        _PARSE_CACHE.popitem(last=False)
 
             if result.quality == DataQuality.ERROR:
                 logger.warning(
-                    f"[{self.name}] Помилка парсингу {url}: {result.error_message}"  # noqa: E501
+                    f"[{name}] Помилка парсингу {url}: {result.error_message}"  # noqa: E501
                 )
                 stats["errors"] += 1
-                continue
+                return None
+
+            # self.repository.save_result(result)  # Removed as orchestrator will do it  # noqa: E501
+            stats["saved"] += 1
+            # Логування збереженого резюме (без поля name)
+            candidate_title = (
+                getattr(result.payload, "title", "Без посади")
+                if result.payload
+                else "Unknown Title"
+            )
+            logger.info(
+                f"[{name}] ✅ Спарсено: Кандидат ({candidate_title})"
+            )
+            return result
 
-            try:
-                # self.repository.save_result(result)  # Removed as orchestrator will do it
-                stats["saved"] += 1
-                results.append(result)
-                # Логування збереженого резюме (без поля name)
-                candidate_title = (
-                    getattr(result.payload, "title", "Без посади")
-                    if result.payload
-                    else "Unknown Title"
-                )
-                logger.info(
-                    f"[{self.name}] ✅ Спарсено: Кандидат ({candidate_title})"
-                )
-            except Exception as e:
-                logger.error(f"[{self.name}] Помилка обробки {url}: {e}")
-                stats["errors"] += 1
+        # gather зберігає порядок urls, тож results упорядковані як раніше
+        task_results = await asyncio.gather(*(_process(url) for url in urls))
+        results = [r for r in task_results if r is not None]
 
         logger.info(
             f"[{self.name}] 🏁 Збір завершено. Спарсено: {len(results)}, Помилок: {stats['errors']}, Пропущено: {stats['skipped']}"  # noqa: E501
@@ -319,7 +435,7 @@ class WorkUaAdapter:
 
         slug = self._slugify(key)
         slug = slug.replace("+", "-")
-        slug = re.sub(r"-{2,}", "-", slug).strip("-")
+        slug = _DASH_RUN_RE.sub("-", slug).strip("-")
         return slug
 
     def _encode_params(self, params: Dict[str, Any]) -> str:
@@ -68,6 +68,7 @@ def _patch_analysis_runtime(
     vector_cache.save_analysis = Mock()
     repo = Mock()
     repo.exists.return_value = False
+    repo.filter_new.side_effect = lambda keys: set(keys)
     preview = AsyncMock(
         return_value=preview_data
         or {
@@ -148,7 +149,7 @@ async def test_analysis_parse_flag_on_uses_parser_service_for_deduped_urls(
             ],
         },
     )
-    repo.exists.side_effect = [False, True]
+    repo.filter_new.side_effect = lambda keys: {"123"}
     parser_service_parse = AsyncMock(
         return_value=_parser_service_response(parsed=False)
     )
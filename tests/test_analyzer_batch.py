@@ -0,0 +1,130 @@
+import json
+import re
+
+from app.models.agent import AnalysisResult
+from app.services.analyzer import ResumeAnalyzer
+
+SYSTEM_PROMPT = "You are a resume evaluator."
+
+_BLOCK_RE = re.compile(
+    r'<resume_content id="(\d+)">\n(.*?)\n</resume_content>',
+    re.DOTALL,
+)
+
+
+def _resume(i: int) -> dict:
+    return {
+        "url": f"https://www.work.ua/resumes/{i}/",
+        "payload": {
+            "resume_id": str(i),
+            "title": f"Candidate {i}",
+            "skills": ["Python"],
+        },
+    }
+
+
+def _empty_resume(i: int) -> dict:
+    # Только title: _pre_screen пропускает такие резюме целиком
+    return {
+        "url": f"https://www.work.ua/resumes/{i}/",
+        "payload": {"resume_id": str(i), "title": f"Candidate {i}"},
+    }
+
+
+def _make_llm_stub(calls: list, drop_ids: set[int] | None = None):
+    """
+    Стаб LLM: разбирает блоки <resume_content id="j"> из батч-промпта и
+    возвращает JSON-массив в ОБРАТНОМ порядке — сопоставление ответов
+    входу должно опираться на поле id, а не на порядок массива.
+    """
+
+    def llm_chat(messages):
+        calls.append(messages)
+        user_content = messages[-1]["content"]
+        items = []
+        for rid_str, text in _BLOCK_RE.findall(user_content):
+            rid = int(rid_str)
+            if drop_ids and rid in drop_ids:
+                continue
+            marker = re.search(r"Candidate \d+", text).group(0)
+            items.append(
+                {
+                    "id": rid,
+                    "status": "GREEN",
+                    "reasoning": f"ok: {marker}",
+                }
+            )
+        items.reverse()
+        return json.dumps(items, ensure_ascii=False)
+
+    return llm_chat
+
+
+def test_analyze_batch_chunks_by_batch_size():
+    calls: list = []
+    analyzer = ResumeAnalyzer(
+        llm_chat=_make_llm_stub(calls), system_prompt=SYSTEM_PROMPT
+    )
+    n = ResumeAnalyzer.BATCH_SIZE + 2
+
+    results = analyzer.analyze_batch(
+        [_resume(i) for i in range(n)], criteria_bundle={}
+    )
+
+    # BATCH_SIZE + 2 резюме -> ровно два запроса к LLM
+    assert len(calls) == 2
+    first_blocks = _BLOCK_RE.findall(calls[0][-1]["content"])
+    second_blocks = _BLOCK_RE.findall(calls[1][-1]["content"])
+    assert len(first_blocks) == ResumeAnalyzer.BATCH_SIZE
+    assert len(second_blocks) == 2
+    assert all(isinstance(r, AnalysisResult) for r in results)
+
+
+def test_analyze_batch_aligns_results_with_input_order():
+    calls: list = []
+    analyzer = ResumeAnalyzer(
+        llm_chat=_make_llm_stub(calls), system_prompt=SYSTEM_PROMPT
+    )
+    resumes = [_resume(i) for i in range(4)]
+
+    results = analyzer.analyze_batch(resumes, criteria_bundle={})
+
+    assert len(results) == 4
+    for i, result in enumerate(results):
+        assert result is not None
+        assert result.status == "GREEN"
+        # Ответы отданы стабом в обратном порядке, но поле id должно
+        # вернуть каждый результат на позицию своего резюме.
+        assert result.reasoning == f"ok: Candidate {i}"
+
+
+def test_analyze_batch_missing_id_yields_none():
+    calls: list = []
+    analyzer = ResumeAnalyzer(
+        llm_chat=_make_llm_stub(calls, drop_ids={1}),
+        system_prompt=SYSTEM_PROMPT,
+    )
+
+    results = analyzer.analyze_batch(
+        [_resume(i) for i in range(3)], criteria_bundle={}
+    )
+
+    assert results[0] is not None and results[2] is not None
+    assert results[1] is None
+
+
+def test_analyze_batch_skips_empty_resumes_without_llm_call():
+    calls: list = []
+    analyzer = ResumeAnalyzer(
+        llm_chat=_make_llm_stub(calls), system_prompt=SYSTEM_PROMPT
+    )
+
+    results = analyzer.analyze_batch(
+        [_empty_resume(0), _resume(1)], criteria_bundle={}
+    )
+
+    # Пустое (только title) резюме не попадает в промпт вовсе
+    assert results[0] is None
+    assert results[1] is not None
+    assert len(calls) == 1
+    assert len(_BLOCK_RE.findall(calls[0][-1]["content"])) == 1
@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import pytest
+from google.genai.errors import APIError
+from tenacity import AsyncRetrying, wait_fixed
+
+import app.services.llm_client as llm_client
+
+
+class _FakeAioModels:
+    """Подменяет client.aio.models.generate_content в тестах."""
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def generate_content(self, model, contents, config):
+        return await self._handler(contents)
+
+
+class _FakeClient:
+    def __init__(self, handler):
+        self.aio = type("Aio", (), {"models": _FakeAioModels(handler)})()
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _messages(i: int) -> list:
+    return [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": f"resume {i}"},
+    ]
+
+
+def _patch_client(monkeypatch, handler):
+    client = _FakeClient(handler)
+    monkeypatch.setattr(llm_client, "_get_client", lambda: client)
+
+
+@pytest.mark.asyncio
+async def test_areal_llm_chat_returns_responses_in_input_order(monkeypatch):
+    async def handler(contents):
+        # Первые запросы завершаются позже: порядок завершения обратный
+        idx = int(contents.strip().rsplit(" ", 1)[-1])
+        await asyncio.sleep((5 - idx) * 0.01)
+        return _Response(json.dumps({"echo": idx}))
+
+    _patch_client(monkeypatch, handler)
+
+    out = await llm_client.areal_llm_chat([_messages(i) for i in range(5)])
+
+    assert [json.loads(raw)["echo"] for raw in out] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_areal_llm_chat_bounds_concurrency(monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(contents):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _Response("{}")
+
+    _patch_client(monkeypatch, handler)
+
+    batch = [_messages(i) for i in range(llm_client._LLM_CONCURRENCY * 3)]
+    await llm_client.areal_llm_chat(batch)
+
+    assert max_in_flight <= llm_client._LLM_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_areal_llm_chat_retries_api_errors(monkeypatch):
+    # Убираем exponential-паузы ретраев, сама политика остаётся той же
+    def fast_retrying(**kwargs):
+        kwargs["wait"] = wait_fixed(0)
+        return AsyncRetrying(**kwargs)
+
+    monkeypatch.setattr(llm_client, "AsyncRetrying", fast_retrying)
+
+    attempts = 0
+
+    async def handler(contents):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise APIError(429, {"error": {"message": "quota"}})
+        return _Response('{"ok": true}')
+
+    _patch_client(monkeypatch, handler)
+
+    out = await llm_client.areal_llm_chat([_messages(0)])
+
+    assert out == ['{"ok": true}']
+    assert attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_areal_llm_chat_rejects_non_json_response(monkeypatch):
+    async def handler(contents):
+        return _Response("not json at all")
+
+    _patch_client(monkeypatch, handler)
+
+    with pytest.raises(ValueError):
+        await llm_client.areal_llm_chat([_messages(0)])
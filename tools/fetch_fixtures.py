@@ -57,7 +57,7 @@ def classify_page(
     """
     Классификация страницы. OK ставим только при наличии позитивных признаков.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     lower_html = html.lower()
 
     # 1. Negative Checks (WAF / Captcha)
@@ -146,7 +146,7 @@ async def fetch_fixture(
             fetched_at = datetime.now(timezone.utc).isoformat()
 
             try:
-                resp = await client.get(url)
+                resp = await client.get(url, follow_redirects=True)
             except Exception as e:
                 logger.error(f"❌ Transport Error: {e}")
                 return